@@ -1,21 +1,42 @@
 from gtts import gTTS
 import os
 import speech_recognition as sr
-from langdetect import detect
 import webbrowser
 import subprocess
 import random
 import sys
-import requests
 import json
 import re
-from datetime import datetime
 import time
 import urllib.parse
+import io
+import atexit
+import asyncio
+import threading
+from collections import deque
 
 # Import our AI components
-from ai_handler import EdithAIHandler
+from ai_handler import EdithAIHandler, as_utterance
 from translation_handler import TranslationHandler
+from intent_engine import IntentEngine
+from intent_matcher import classify_intent
+from http_client import get_http_client
+from audio_player import AudioPlayer
+from tts_cache import TTSCache
+from cache_store import get_cache_dir
+from geocoding_cache import GeocodingCache
+from weather_service import WeatherService
+from utterance import Utterance
+from conversation_memory import ConversationMemory
+from prompt_registry import PROMPTS, usage_tracker
+from voice_listener import VoiceListener
+from speculative import get_speculative_executor
+from disengagement_classifier import DISENGAGEMENT_CLASSIFIER
+from answer_cache import get_answer_cache
+from app_registry import APP_REGISTRY
+from app_inventory import AppInventory
+from learned_urls import LearnedUrls, validate_web_url
+from conversation_logger import ConversationLogger
 
 # Get Mistral API key from environment variable
 MISTRAL_API_KEY = os.getenv('MISTRAL_API_KEY')
@@ -25,11 +46,61 @@ if not MISTRAL_API_KEY:
     print("Or add it to your .env file")
     sys.exit(1)
 
-CONVERSATION_LOG_FILE = "conversations.txt"
+CONVERSATION_LOG_FILE = "conversations.jsonl"
 
 MAX_TIMEOUT_ATTEMPTS = 3
-conversation_context = []
 timeout_manager = None
+voice_listener = None  # Persistent microphone session, opened once at startup
+
+# Structured conversation log - one JSON line per turn, batched to disk by a writer thread
+conversation_logger = ConversationLogger(CONVERSATION_LOG_FILE)
+atexit.register(conversation_logger.close)
+
+# Pooled keep-alive transport shared by every Mistral/HTTP helper
+http_client = get_http_client()
+http_client.configure_mistral(MISTRAL_API_KEY)
+
+# Background playback queue - speak() returns as soon as the audio is queued
+audio_player = AudioPlayer(rate=1.2)
+atexit.register(audio_player.wait)  # Let the last utterance finish before exiting
+
+# What SYRA said most recently - lets the async pipeline ignore its own voice on the mic
+recent_speech = deque(maxlen=5)
+
+# gTTS voice settings - part of the phrase cache key
+TTS_VOICE = {'lang': 'en', 'slow': False}
+tts_cache = TTSCache()
+# Streamed reply sentences get their own smaller cache so they can't evict the fixed phrases
+dynamic_tts_cache = TTSCache(cache_dir=get_cache_dir('tts_dynamic'), max_bytes=10 * 1024 * 1024, max_entries=200)
+
+# Place name -> coordinates; repeat weather queries skip the AI lookup
+geocoding_cache = GeocodingCache()
+
+# Current conditions by rounded lat/lon - hot cities are served locally for the cache window
+weather_service = WeatherService(http_client)
+
+# The one record of this session's turns - the AI handler replays it, timeouts read from it
+conversation_memory = ConversationMemory()
+
+# Spoken app names -> catalog entries, indexed once for opening and closing
+app_registry = APP_REGISTRY
+
+# Websites the AI found for apps that aren't installed - merged into the registry so they open with no lookup
+learned_urls = LearnedUrls()
+for learned_name, learned_url in learned_urls.items():
+    app_registry.add_web_app(learned_name, learned_url)
+
+# What's installed locally, scanned in the background - opening an app needs no trial launches
+app_inventory = AppInventory()
+
+# Answers to repeat questions, shared by web search and the chat handler
+answer_cache = get_answer_cache()
+
+# One structured classification per utterance - the helpers below read from it
+intent_engine = IntentEngine(MISTRAL_API_KEY)
+
+# Search probes run side by side under one deadline instead of back to back
+speculative_executor = get_speculative_executor()
 
 def clean_markdown_response(text):
     """Remove markdown formatting from AI responses"""
@@ -57,56 +128,27 @@ def detect_user_disengagement(query):
     if not query:
         return False
     
-    prompt = f"""
-
-    Analyze if the user wants to STOP or DISENGAGE from the conversation with the AI assistant.
-    
-    User said: "{query}"
+    # Clear continues ("open safari") and clear stops ("bye") are settled without a round trip
+    decision, reason = DISENGAGEMENT_CLASSIFIER.classify(query)
+    if decision is not None:
+        if decision:
+            print(f"👋 Disengagement detected locally ({reason})")
+        return decision
     
-    Reply ONLY with "YES" if they want to stop/disengage, or "NO" if they want to continue.
-    
-    DISENGAGEMENT SIGNALS (YES):
-    - "I don't want to say anything"
-    - "I'm not in good mood to talk"
-    - "Leave me alone"
-    - "Stop talking"
-    - "I don't want to chat"
-    - "Not interested"
-    - "Go away"
-    - "I'm busy"
-    - "Not now"
-    - "Goodbye" (when said alone)
-    - "Bye" (when said alone)
-    - "That's all for now"
-    - "I'm done"
-    
-    CONTINUE SIGNALS (NO):
-    - "Close [app name]" → NO (app command, not disengagement)
-    - "Let's close [app name]" → NO (app command, not disengagement)
-    - "Open [app name]" → NO (app command)
-    - "Search for something" → NO (search request)
-    - Normal questions or conversations → NO
-    - Requests for help → NO
-    - Any productive interaction → NO
-    
-    CRITICAL: If the user mentions closing/opening specific applications (like "close Gemini", "close Gmail", "open Safari"), this is NOT disengagement - they want to control apps.
-    
-    """
+    intent = intent_engine.classify(query)
+    if intent is not None:
+        return intent['disengage']
     
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('disengagement', query=query),
                 "max_tokens": 10,
                 "temperature": 0.1
             },
-            timeout=8
+            timeout=8,
+            label='disengagement'
         )
 
         if response.status_code == 200:
@@ -128,37 +170,16 @@ def generate_contextual_confirmation(conversation_history):
     recent_context = conversation_history[-3:] if len(conversation_history) > 3 else conversation_history
     context_text = " | ".join([f"You: {item['user']} -> SYRA: {item['syra'][:50]}..." for item in recent_context])
 
-    prompt = f"""
-    Based on our recent conversation, generate a natural check-in message.
-    
-    Recent conversation context: {context_text}
-    
-    Create a brief, caring message that:
-    1. Acknowledges we were discussing something specific
-    2. Asks if they want to continue or need help with something else
-    3. Sounds natural and personal
-    
-    Examples:
-    - "Are you still there? Were you interested in learning more about those habits we discussed?"
-    - "I was helping you with app management - did you want to continue or try something else?"
-    - "We were talking about search features - are you still there sir?"
-    
-    Generate one natural check-in message:"""
-    
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('contextual_confirmation', context_text=context_text),
                 "max_tokens": 50,
                 "temperature": 0.7
             },
-            timeout=8
+            timeout=8,
+            label='contextual_confirmation'
         )
         
         if response.status_code == 200:
@@ -173,6 +194,13 @@ def generate_contextual_confirmation(conversation_history):
     
 class TimeoutManager:
 
+    FIRST_TIMEOUT_RESPONSE = "I couldn't hear you properly sir. Please try again."
+    FAREWELL_MESSAGES = [
+        "I understand you might be busy or not in the mood to chat right now. Feel free to wake me up anytime you need assistance. Have a wonderful day boss!",
+        "It seems like you might have stepped away or are busy with something important. I'll be here whenever you need help. Take care boss!",
+        "I respect that you might not want to continue right now. Remember, I'm always here to help with web searches, opening applications, or just having a chat. Have a great day sir!"
+    ]
+
     def __init__(self):
         self.failed_attempts = 0
         self.max_attempts = MAX_TIMEOUT_ATTEMPTS
@@ -192,71 +220,44 @@ class TimeoutManager:
     def get_timeout_response(self, conversation_history):
 
         if self.failed_attempts == 1:
-            return "I couldn't hear you properly sir. Please try again."
+            return self.FIRST_TIMEOUT_RESPONSE
         
         elif self.failed_attempts == 2:
             return generate_contextual_confirmation(conversation_history)
         
         elif self.failed_attempts >= 3:
-            farewell_messages = [
-               "I understand you might be busy or not in the mood to chat right now. Feel free to wake me up anytime you need assistance. Have a wonderful day boss!",
-                "It seems like you might have stepped away or are busy with something important. I'll be here whenever you need help. Take care boss!",
-                "I respect that you might not want to continue right now. Remember, I'm always here to help with web searches, opening applications, or just having a chat. Have a great day sir!"
-            ]
-
-            return random.choice(farewell_messages)
+            return random.choice(self.FAREWELL_MESSAGES)
         return "I couldn't hear you properly sir. Please try again by refining your query."
     
 def update_conversation_context(user_input, assistant_response):
+    """Track a turn the AI handler doesn't record itself (system commands)"""
+    # Bounded ring buffer - older turns are folded into a rolling summary
+    conversation_memory.add_turn(user_input, assistant_response, kind='command')
+    print(f"📝 Context updated: {len(conversation_memory)} exchanges tracked")
 
-    global conversation_context
+def log_conversation(user_input, assistant_response, response_time=None, query_type=None, ai_refined=None,
+                     event='turn'):
+    """Enhanced conversation logging with performance metrics - queued, written in the background"""
+    conversation_logger.log(user_input, assistant_response, response_time, query_type, ai_refined, event)
 
-    conversation_context.append({
-        'user': user_input,
-        'syra': assistant_response,
-        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    # Keep only last 5 exchanges to avoid memory issues
-    if len(conversation_context) > 5:
-       
-        conversation_context = conversation_context[-5:]
+def open_voice_listener(calibration_duration=0.5, audio_source=None):
+    """Open the persistent microphone session used by every recognition() turn"""
+    global voice_listener
+    
+    listener = VoiceListener(is_quiet=lambda: not audio_player.is_busy(), microphone=audio_source)
+    listener.open(calibration_duration=calibration_duration)
+    atexit.register(listener.close)
+    voice_listener = listener
+    return listener
 
-    print(f"📝 Context updated: {len(conversation_context)} exchanges tracked")
-
-def log_conversation(user_input, assistant_response, response_time=None, query_type=None, ai_refined=None):
-    """Enhanced conversation logging with performance metrics"""
-    try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        with open(CONVERSATION_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"\n[{timestamp}]\n")
-            f.write(f"YOU: {user_input}\n")
-            f.write(f"SYRA: {assistant_response}\n")
-            
-            # Add performance metrics
-            if response_time:
-                f.write(f"⏱️ Response Time: {response_time:.2f} seconds\n")
-            
-            if query_type:
-                f.write(f"🎯 Query Type: {query_type}\n")
-                
-            if ai_refined:
-                f.write(f"🧠 AI Refined: {ai_refined}\n")
-            
-            f.write("-" * 50 + "\n")
-            
-    except Exception as e:
-        print(f"Error logging conversation: {e}")
-
-def check_microphone_permission():
+def check_microphone_permission(audio_source=None):
     """Check if microphone permission is granted and guide user if not"""
     try:
-        recognizer = sr.Recognizer()
-        with sr.Microphone() as source:
-            print("Testing microphone access...")
-            recognizer.adjust_for_ambient_noise(source, duration=0.5)
-            print("✅ Microphone access granted!")
-            return True
+        print("Testing microphone access...")
+        # The one-time calibration here is reused by every later turn
+        open_voice_listener(calibration_duration=0.5, audio_source=audio_source)
+        print("✅ Microphone access granted!")
+        return True
     except Exception as e:
         print("❌ Microphone access denied or not available!")
         print(f"Error: {e}")
@@ -268,53 +269,101 @@ def check_microphone_permission():
         print("5. Check the box next to it to enable microphone access")
         return False
 
-def speak(text):
-    """SYRA speak in english with faster speed"""
+def _synthesize_with_gtts(clean_text):
+    """Run gTTS over the network and return the mp3 bytes"""
+    # Use faster speech settings with speed optimization
+    tts = gTTS(text=clean_text, **TTS_VOICE)
+    buffer = io.BytesIO()
+    tts.write_to_fp(buffer)
+    return buffer.getvalue()
+
+def synthesize_speech(clean_text):
+    """Synthesize already-cleaned text to an in-memory mp3 buffer, served from the phrase cache when possible"""
+    cache = tts_cache if clean_text in FIXED_PHRASE_TEXTS else dynamic_tts_cache
+    audio_bytes = cache.get(clean_text, **TTS_VOICE)
+    if audio_bytes is None:
+        audio_bytes = _synthesize_with_gtts(clean_text)
+        cache.put(clean_text, audio_bytes, **TTS_VOICE)
+    return audio_bytes
+
+def speak(text, block=False):
+    """SYRA speak in english with faster speed - queued on the background player"""
     try:
         clean_text = clean_markdown_response(text)
-        # Use faster speech settings with speed optimization
-        tts = gTTS(text=clean_text, lang='en', slow=False)
-        tts.save('output.mp3')
-        # Use faster audio playback - mpg123 doesn't support --rate, use afplay with speed
-        try:
-            # Try afplay first (macOS built-in, supports speed control)
-            os.system('afplay -r 1.2 output.mp3')
-        except:
-            # Fallback to mpg123 without speed control
-            os.system('mpg123 --quiet output.mp3')
+        if audio_player.enqueue(synthesize_speech(clean_text)):
+            recent_speech.append(clean_text)
+        if block:
+            audio_player.wait()
     except Exception as e:
         print(f"TTS Error: {e}")
         print(f"SYRA: {text}")
 
-def recognition():
-    """Optimized voice recognition function"""
-    recognizer = sr.Recognizer()
-    
-    # Optimize recognizer settings for better performance
-    recognizer.energy_threshold = 300
-    recognizer.dynamic_energy_threshold = True
-    recognizer.pause_threshold = 0.6  # Faster response
-    
-    with sr.Microphone() as source:
-        print("Listening...")
-        # Faster ambient noise adjustment
-        recognizer.adjust_for_ambient_noise(source, duration=0.3)
+def speak_stream(sentences, cancel_event=None):
+    """Speak sentences as they arrive - the next one is synthesized while the current one plays"""
+    spoken = []
+    for sentence in sentences:
+        if cancel_event is not None and cancel_event.is_set():
+            # Barge-in - stop pulling from the LLM stream
+            if hasattr(sentences, 'close'):
+                sentences.close()
+            break
+        clean_sentence = clean_markdown_response(sentence)
+        if not clean_sentence:
+            continue
         try:
-            audio = recognizer.listen(source, phrase_time_limit=6, timeout=10)  # Increased timeout
-            print("Recognizing...")
-            query = recognizer.recognize_google(audio, language='en-IN')
-            detect_language = detect(query)
-            print(f"Creator: {query}")
-            return query.lower(), detect_language
-        except sr.WaitTimeoutError:
-            print("Listening timeout - please try again")
-            return None, None
-        except sr.UnknownValueError:
-            print("Could not understand audio")
-            return None, None
-        except sr.RequestError:
-            print("Could not connect to the server")
-            return None, None
+            # A barge-in while this sentence synthesizes bumps the generation, so it never plays
+            generation = audio_player.generation
+            audio_bytes = synthesize_speech(clean_sentence)
+            if cancel_event is not None and cancel_event.is_set():
+                continue
+            # Only sentences that will actually play count as spoken - for the log, memory and echo check
+            if audio_player.enqueue(audio_bytes, generation):
+                spoken.append(clean_sentence)
+                recent_speech.append(clean_sentence)
+        except Exception as e:
+            print(f"TTS Error: {e}")
+            print(f"SYRA: {clean_sentence}")
+    
+    return " ".join(spoken)
+
+def stop_speaking():
+    """Interrupt the current utterance and drop anything still queued"""
+    audio_player.interrupt()
+
+def is_echo(query, overlap=0.8):
+    """True if a recognized phrase is mostly words SYRA just said"""
+    query_words = re.findall(r"[a-z']+", query.lower())
+    if not query_words:
+        return False
+    spoken_words = set(re.findall(r"[a-z']+", " ".join(recent_speech).lower()))
+    matched = sum(1 for word in query_words if word in spoken_words)
+    return matched / len(query_words) >= overlap
+
+def recognition(wait_for_speech=True):
+    """Optimized voice recognition function - reuses the persistent microphone session.
+    Returns the turn's Utterance, or None if nothing was recognized"""
+    listener = voice_listener or open_voice_listener(calibration_duration=0.3)
+    
+    # Let SYRA finish speaking so the mic doesn't hear her own voice
+    # (the async pipeline listens through playback so the user can barge in)
+    if wait_for_speech:
+        audio_player.wait()
+    print("Listening...")
+    try:
+        audio = listener.listen(phrase_time_limit=6, timeout=10)  # Increased timeout
+        print("Recognizing...")
+        query = listener.recognize(audio, language='en-IN')
+        print(f"Creator: {query}")
+        return Utterance.from_speech(query)
+    except sr.WaitTimeoutError:
+        print("Listening timeout - please try again")
+        return None
+    except sr.UnknownValueError:
+        print("Could not understand audio")
+        return None
+    except sr.RequestError:
+        print("Could not connect to the server")
+        return None
 
 def is_video_search_query(query):
     """Enhanced video search detection with priority for video keywords"""
@@ -364,48 +413,21 @@ def is_video_search_query(query):
             print(f"🎬 VIDEO action pattern detected: '{pattern}' in query")
             return True
     
-    # PRIORITY 4: AI fallback for complex cases
-    prompt = f"""
-    IMPORTANT: Analyze if user wants VIDEO content or TEXT/INFO content.
-
-    Query: "{query}"
-    
-    Reply ONLY with "YES" for video content or "NO" for text/info content.
-    
-    VIDEO CONTENT (YES):
-    - Contains: "video", "videos", "watch", "movie", "film", "scene", "youtube", "on youtube"
-    - Contains: "find out video", "check out video", "search video", "video of"
-    - Examples: "I want to watch a video of iPhone 15 Pro review" → YES
-    - Examples: "video of MacBook Pro review" → YES
-    - Examples: "let's find out video of cats" → YES
-    - Examples: "check out video of Tesla" → YES
-    - Examples: "search apple's news on Youtube" → YES
-    - Examples: "find out openai latest update on youtube" → YES
-    - Examples: "search video of funny dogs" → YES
-    
-    TEXT/INFO CONTENT (NO):
-    - Wants: specs, price, information, facts, reviews (without video keywords)
-    - Examples: "Tesla stock price" → NO
-    - Examples: "iPhone 15 specifications" → NO
-    - Examples: "search Tesla news" → NO (no video keyword)
-    
-    CRITICAL RULE: If query contains ANY video-related keywords (video, youtube, watch, movie, film) = YES, even if it also contains "search" or "find".
-    """
+    # PRIORITY 4: AI fallback for complex cases - shared structured intent first
+    intent = intent_engine.classify(query)
+    if intent is not None:
+        return intent['video']
     
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('video_query', query=query),
                 "max_tokens": 10,
                 "temperature": 0.1
             },
-            timeout=8
+            timeout=8,
+            label='video_query'
         )
         
         if response.status_code == 200:
@@ -421,42 +443,13 @@ def is_video_search_query(query):
 
 def is_weather_query(query):
     """Detect weather-related queries with high priority - these should NEVER go to web search"""
-    weather_keywords = [
-        'weather', 'temperature', 'temp', 'hot', 'cold', 'sunny', 'rainy', 'cloudy',
-        'forecast', 'climate', 'degrees', 'celsius', 'fahrenheit', 'humid', 'humidity',
-        'precipitation', 'rain', 'snow', 'storm', 'wind', 'windy'
-    ]
-    
-    query_lower = query.lower()
-    
-    # Check for weather keywords
-    for keyword in weather_keywords:
-        if keyword in query_lower:
-            print(f"🌤️ WEATHER keyword detected: '{keyword}' in query")
-            return True
-    
-    # Check for weather-specific patterns
-    weather_patterns = [
-        r'\bhow\'?s\s+(?:the\s+)?weather',
-        r'\bwhat\'?s\s+(?:the\s+)?weather',
-        r'\bcheck\s+(?:the\s+)?weather',
-        r'\bget\s+(?:the\s+)?weather',
-        r'\bfind\s+(?:the\s+)?weather',
-        r'\bweather\s+(?:in|of|for|at)',
-        r'\btemperature\s+(?:in|of|for|at)',
-        r'\bhow\s+(?:hot|cold|warm)\s+is\s+it',
-        r'\bis\s+it\s+(?:hot|cold|warm|sunny|rainy)',
-        r'\bwill\s+it\s+rain',
-        r'\bis\s+it\s+raining'
-    ]
-    
-    import re
-    for pattern in weather_patterns:
-        if re.search(pattern, query_lower):
-            print(f"🌤️ WEATHER pattern detected: '{pattern}' in query")
-            return True
+    # Same rule table as EdithAIHandler.detect_system_command; weather rules outrank all others
+    result = classify_intent(query)
+    if result is None or result[0] != 'weather_query':
+        return False
     
-    return False
+    print(f"🌤️ WEATHER {result[1]} detected in query")
+    return True
 
 def is_search_related_query(query):
     """Determine if query is search-related using AI for 100% accuracy - EXCLUDES weather queries"""
@@ -466,62 +459,20 @@ def is_search_related_query(query):
         print(f"🌤️ Weather query detected - routing to weather API, NOT web search")
         return False  # Weather queries are handled separately, not web search
     
-    prompt = f"""
-    Analyze this user query and determine if it requires a web search, video search, or real-time information.
-    
-    Query: "{query}"
-    
-    Respond with only "YES" if it needs any kind of search/information lookup, or "NO" if it doesn't.
-    
-    IMPORTANT: Weather queries should be marked as "NO" since they use dedicated weather API.
-    
-    SEARCH/INFO QUERIES (YES):
-    - "I want you to find Tesla stock price" → YES
-    - "Let's search about climate change" → YES  
-    - "I want to watch Avengers movie" → YES
-    - "I want to watch a video of dogs" → YES
-    - "hey I want to watch a video of iPhone 15 Pro review" → YES
-    - "let's search out today's market" → YES
-    - "I want to check price of IBM" → YES
-    - "what's today's Australian news" → YES
-    - "who won the latest football match" → YES
-    - "get me latest Tesla stock price" → YES
-    - "what's happening in the world" → YES
-    - "current Bitcoin price" → YES
-    - "latest iPhone features" → YES
-    - "search for something" → YES
-    - "find information about" → YES
-    - "look up" → YES
-    
-    NON-SEARCH QUERIES (NO):
-    - "Open calculator" → NO
-    - "Close Safari" → NO
-    - "How are you" → NO
-    - "Open Microsoft Word" → NO
-    - "Launch an app" → NO
-    - "Good morning" → NO
-    - "Thank you" → NO
-    - "what's the weather like" → NO (uses weather API)
-    - "temperature in Melbourne" → NO (uses weather API)
-    - "how's the weather" → NO (uses weather API)
-    
-    DECISION RULE: If user wants to FIND, SEARCH, WATCH, get current/real-time information, prices, news, or any content from the internet = YES. If they want to open/close apps, have simple conversations, or ask about WEATHER = NO.
-    """
+    intent = intent_engine.classify(query)
+    if intent is not None:
+        return intent['search']
     
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('search_query', query=query),
                 "max_tokens": 10,
                 "temperature": 0.1
             },
-            timeout=8
+            timeout=8,
+            label='search_query'
         )
         
         if response.status_code == 200:
@@ -537,38 +488,20 @@ def is_search_related_query(query):
 
 def get_ai_refined_search_query(query):
     """Get AI-refined search query for perfect web search - 100% accuracy"""
-    prompt = f"""
-    User wants to search the web. Extract the perfect search query from their request.
-    
-    User Request: "{query}"
-    
-    Provide ONLY the exact search terms needed for Google search. No explanations, no greetings, no extra words.
-    
-    Examples:
-    - "I want you to find Tesla stock price" → tesla stock price
-    - "Let's search about climate change effects" → climate change effects
-    - "I want to watch Avengers Endgame movie" → Avengers Endgame movie
-    - "Let's listen to Bohemian Rhapsody by Queen" → Bohemian Rhapsody Queen
-    - "Find information about iPhone 15 reviews" → iPhone 15 reviews
-    - "a car on a web browser" → car
-    - "search a sport car on web browser" → sport car
-    
-    Search Query:"""
+    intent = intent_engine.classify(query)
+    if intent is not None and intent['search_query']:
+        return intent['search_query']
     
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('refine_search_query', query=query),
                 "max_tokens": 50,
                 "temperature": 0.2
             },
-            timeout=8
+            timeout=8,
+            label='refine_search_query'
         )
         
         if response.status_code == 200:
@@ -590,46 +523,20 @@ def is_direct_search_query(query):
 
 def needs_ai_web_search(query):
     """Determine if query needs real-time info but doesn't explicitly say 'search'"""
-    prompt = f"""
-    Analyze if this query needs CURRENT/REAL-TIME information that requires web search.
-    
-    Query: "{query}"
-    
-    Reply ONLY with "YES" if it needs current info, or "NO" if it doesn't.
-    
-    NEEDS CURRENT INFO (YES):
-    - "I want to check price of IBM" → YES (stock prices change)
-    - "what's today's Australian news" → YES (news is current)
-    - "current Bitcoin price" → YES (prices change)
-    - "latest iPhone features" → YES (product info changes)
-    - "who won the latest football match" → YES (sports results)
-    - "what's the weather like" → YES (weather changes)
-    - "Tesla stock price today" → YES (stock prices)
-    
-    DOESN'T NEED CURRENT INFO (NO):
-    - "How are you" → NO (general conversation)
-    - "Open calculator" → NO (app command)
-    - "what is 2+2" → NO (basic math)
-    - "tell me a joke" → NO (general AI capability)
-    - "good morning" → NO (greeting)
-    
-    DECISION: Does this query require CURRENT/REAL-TIME information from the internet?
-    """
+    intent = intent_engine.classify(query)
+    if intent is not None:
+        return intent['needs_current_info']
     
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('needs_current_info', query=query),
                 "max_tokens": 10,
                 "temperature": 0.1
             },
-            timeout=8
+            timeout=8,
+            label='needs_current_info'
         )
         
         if response.status_code == 200:
@@ -645,38 +552,31 @@ def needs_ai_web_search(query):
 
 def get_mistral_web_search_response(query):
     """Use Mistral AI for real-time information - simplified approach"""
+    # Repeat questions are answered locally until their freshness window closes
+    cached = answer_cache.get(query, scope='web')
+    if cached is not None:
+        return cached
+    
     try:
         print(f"🔍 Using Mistral AI for current info: '{query}'")
         
         # Use direct chat completions with web search instructions
-        enhanced_prompt = f"""
-        Please provide current, up-to-date information about: {query}
-        
-        If this requires current/real-time data (like stock prices, news, weather, sports results), 
-        please indicate that you would need to search the web for the latest information.
-        
-        Query: {query}
-        """
-        
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": enhanced_prompt}],
+                "messages": PROMPTS.messages('web_search_answer', query=query),
                 "max_tokens": 200,
                 "temperature": 0.3
             },
-            timeout=15
+            timeout=15,
+            label='web_search_answer'
         )
         
         if response.status_code == 200:
             result = response.json()
             ai_response = result['choices'][0]['message']['content'].strip()
             print(f"✅ Mistral response: {ai_response[:100]}...")
+            answer_cache.put(query, ai_response, scope='web')
             return ai_response
         else:
             print(f"Mistral API failed: {response.status_code}")
@@ -686,41 +586,66 @@ def get_mistral_web_search_response(query):
         print(f"Mistral web search error: {e}")
         return None
 
+SIMPLE_INFO_PATTERNS = [
+    r'\bwhat\s+is\s+',
+    r'\btell\s+me\s+(?:about\s+|the\s+information\s+about\s+)',
+    r'\blet\s+me\s+know\s+(?:about\s+|the\s+information\s+about\s+)',
+    r'\binformation\s+about\s+',
+    r'\bwho\s+is\s+',
+    r'\bhow\s+(?:does|do)\s+',
+    r'\bwhere\s+is\s+',
+    r'\bwhen\s+(?:was|is)\s+',
+    r'\bwhy\s+(?:is|does)\s+',
+]
+
+def is_simple_info_query(query):
+    """Simple information questions (what is X, tell me about X) that Mistral answers directly"""
+    query_lower = query.lower()
+    return any(re.search(pattern, query_lower) for pattern in SIMPLE_INFO_PATTERNS)
+
 def extract_search_query_advanced(query):
-    """Enhanced search query extraction with two-tier system - VIDEO DETECTION FIRST"""
+    """Enhanced search query extraction with two-tier system - VIDEO DETECTION FIRST.
+
+    The LLM probes are independent of each other, so every one the decision might need
+    starts at once under a shared deadline; the decision tree below reads only what it needs.
+    """
     
     # First, check if this is a search-related query using AI
     print(f"🧠 AI analyzing query: '{query}'")
     
-    is_search_query = is_search_related_query(query)
+    # Weather queries never go to web search - decided locally, no probes needed
+    if is_weather_query(query):
+        print(f"🌤️ Weather query detected - routing to weather API, NOT web search")
+        print("🚫 AI detected: Not a search query")
+        return None
     
-    if is_search_query:
+    simple_info = is_simple_info_query(query)
+    direct_search = is_direct_search_query(query)
+    
+    with speculative_executor.round() as probes:
+        probes.submit('search', is_search_related_query, query)
+        if not simple_info:
+            probes.submit('video', is_video_search_query, query)
+            probes.submit('refine', get_ai_refined_search_query, query)
+            if not direct_search:
+                probes.submit('current_info', needs_ai_web_search, query)
+        
+        if not probes.result('search', False):
+            print("🚫 AI detected: Not a search query")
+            return None
+        
         print("✅ AI detected: Search/Info query")
         
         # PRIORITY 1: Check if it's a simple information query (what is X, tell me about X)
-        simple_info_patterns = [
-            r'\bwhat\s+is\s+',
-            r'\btell\s+me\s+(?:about\s+|the\s+information\s+about\s+)',
-            r'\blet\s+me\s+know\s+(?:about\s+|the\s+information\s+about\s+)',
-            r'\binformation\s+about\s+',
-            r'\bwho\s+is\s+',
-            r'\bhow\s+(?:does|do)\s+',
-            r'\bwhere\s+is\s+',
-            r'\bwhen\s+(?:was|is)\s+',
-            r'\bwhy\s+(?:is|does)\s+',
-        ]
-        
-        import re
-        for pattern in simple_info_patterns:
-            if re.search(pattern, query.lower()):
-                print("🤖 Simple information query detected - using Mistral AI")
-                return "MISTRAL_WEB_SEARCH"  # Use AI to answer directly
+        if simple_info:
+            print("🤖 Simple information query detected - using Mistral AI")
+            return "MISTRAL_WEB_SEARCH"  # Use AI to answer directly
         
         # PRIORITY 2: Check if it's a VIDEO query (before other logic)
-        if is_video_search_query(query):
+        if probes.result('video', False):
             print("🎬 VIDEO SEARCH detected - extracting video search terms")
             # Get AI-refined search terms for video
-            ai_refined_query = get_ai_refined_search_query(query)
+            ai_refined_query = probes.result('refine')
             
             if ai_refined_query and len(ai_refined_query.strip()) > 0:
                 print(f"🎯 Video search query: '{ai_refined_query}'")
@@ -731,10 +656,10 @@ def extract_search_query_advanced(query):
                 return extract_video_terms(query)
         
         # PRIORITY 3: Check if it's a direct search (contains "search", "find", etc.)
-        elif is_direct_search_query(query):
+        elif direct_search:
             print("🔍 Direct search detected - using browser")
             # Get AI-refined search terms for browser
-            ai_refined_query = get_ai_refined_search_query(query)
+            ai_refined_query = probes.result('refine')
             
             if ai_refined_query and len(ai_refined_query.strip()) > 0:
                 print(f"🎯 AI refined query: '{ai_refined_query}'")
@@ -743,15 +668,12 @@ def extract_search_query_advanced(query):
                 print("⚠️ AI refinement failed, using regex fallback")
         
         # PRIORITY 4: Check if it needs real-time info (indirect search)
-        elif needs_ai_web_search(query):
+        elif probes.result('current_info', False):
             print("🤖 Indirect search detected - using Mistral AI web search")
             return "MISTRAL_WEB_SEARCH"  # Special marker
         else:
             print("💬 Regular conversation query")
             return None
-    else:
-        print("🚫 AI detected: Not a search query")
-        return None
 
 def extract_video_terms(query):
     """Fallback video term extraction"""
@@ -906,43 +828,22 @@ def search_in_safari(search_query):
         return False, f"Error searching in Safari: {e}"
 
 def get_location_coordinates(location_name):
-    """Get latitude and longitude coordinates for a location using AI"""
-    prompt = f"""
-    Get the exact latitude and longitude coordinates for: "{location_name}"
-    
-    Respond with ONLY the coordinates in this format: latitude,longitude
-    
-    Examples:
-    - "Melbourne" → -37.8136,144.9631
-    - "Sydney" → -33.8688,151.2093
-    - "Brisbane" → -27.4698,153.0251
-    - "Perth" → -31.9505,115.8605
-    - "Adelaide" → -34.9285,138.6007
-    - "Canberra" → -35.2809,149.1300
-    - "Darwin" → -12.4634,130.8456
-    - "Hobart" → -42.8821,147.3272
-    - "Geelong" → -38.1499,144.3617
-    - "Gold Coast" → -28.0167,153.4000
-    - "London" → 51.5074,-0.1278
-    - "New York" → 40.7128,-74.0060
-    - "Tokyo" → 35.6762,139.6503
-    
-    Coordinates:"""
+    """Get latitude and longitude coordinates for a location - cached, AI only on a true miss"""
+    coords = geocoding_cache.get(location_name)
+    if coords:
+        print(f"📍 Coordinates for {location_name} from cache")
+        return coords
     
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('coordinates', location_name=location_name),
                 "max_tokens": 50,
                 "temperature": 0.1
             },
-            timeout=10
+            timeout=10,
+            label='coordinates'
         )
         
         if response.status_code == 200:
@@ -952,7 +853,9 @@ def get_location_coordinates(location_name):
             # Parse the coordinates
             try:
                 lat, lon = coords_text.split(',')
-                return float(lat.strip()), float(lon.strip())
+                coords = (float(lat.strip()), float(lon.strip()))
+                geocoding_cache.put(location_name, coords)
+                return coords
             except (ValueError, AttributeError):
                 print(f"Failed to parse coordinates: {coords_text}")
                 return None
@@ -961,26 +864,44 @@ def get_location_coordinates(location_name):
             
     except Exception as e:
         print(f"AI coordinate lookup timeout - using fallback: {e}")
-        # Fallback coordinates for major Australian cities
-        fallback_coords = {
-            'melbourne': (-37.8136, 144.9631),
-            'sydney': (-33.8688, 151.2093),
-            'brisbane': (-27.4698, 153.0251),
-            'perth': (-31.9505, 115.8605),
-            'adelaide': (-34.9285, 138.6007),
-            'canberra': (-35.2809, 149.1300),
-            'darwin': (-12.4634, 130.8456),
-            'hobart': (-42.8821, 147.3272),
-            'geelong': (-38.1499, 144.3617),
-            'gold coast': (-28.0167, 153.4000)
-        }
-        
-        location_lower = location_name.lower().strip()
-        for city, coords in fallback_coords.items():
-            if city in location_lower:
-                return coords
-        
-        return None
+        # Fallback to the offline gazetteer of major cities
+        return geocoding_cache.find_known_city(location_name)
+
+def report_weather(location_name, query):
+    """Speak current conditions for a place - coordinates and conditions both come from caches when warm"""
+    try:
+        # Get coordinates for the location using AI
+        coords = get_location_coordinates(location_name)
+        
+        if coords:
+            lat, lon = coords
+            # Use Open-Meteo API for accurate weather data
+            current = weather_service.current(lat, lon)
+            temperature = current['temperature_2m']
+            feels_like = current['apparent_temperature']
+            humidity = current['relative_humidity_2m']
+            precipitation = current['precipitation']
+            
+            # Create detailed weather response
+            weather_response = f"In {location_name}, it's {temperature}°C and feels like {feels_like}°C. Humidity is {humidity}%"
+            
+            if precipitation > 0:
+                weather_response += f" with {precipitation}mm of precipitation"
+            
+            weather_response += " sir."
+            
+            speak(weather_response)
+            log_conversation(f"Weather in {location_name}", weather_response)
+        else:
+            error_response = f"I couldn't find the location {location_name}. Could you try a different location sir?"
+            speak(error_response)
+            log_conversation(f"Weather error: {location_name}", error_response)
+            
+    except Exception as e:
+        print(f"Weather API error: {e}")
+        error_response = "I'm having trouble getting the weather information sir. Please try again."
+        speak(error_response)
+        log_conversation(query, error_response)
 
 def extract_location_from_weather_query(query):
     """Extract location from weather-related queries using AI and regex patterns"""
@@ -1012,38 +933,26 @@ def extract_location_from_weather_query(query):
                 print(f"🌤️ REGEX: Extracted location '{location}' from weather query")
                 return location.title()
     
-    # If regex fails, use AI to extract location
-    prompt = f"""
-    Extract the location name from this weather query. Reply with ONLY the location name, nothing else.
-    
-    Query: "{query}"
-    
-    Examples:
-    - "find out weather of Melbourne" → Melbourne
-    - "what's the weather in Sydney today" → Sydney  
-    - "check weather in New York" → New York
-    - "Melbourne weather" → Melbourne
-    - "weather in London please" → London
-    - "how's the weather at Brisbane" → Brisbane
-    
-    If no location found, reply with: NONE
-    
-    Location:"""
-    
+    # If regex fails, use the location from the shared structured intent
+    intent = intent_engine.classify(query)
+    if intent is not None:
+        if intent['location']:
+            print(f"🌤️ AI: Extracted location '{intent['location']}' from weather query")
+        else:
+            print(f"🌤️ No location found in query: '{query}'")
+        return intent['location']
+
+    # Otherwise ask AI directly to extract location
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('weather_location', query=query),
                 "max_tokens": 20,
                 "temperature": 0.1
             },
-            timeout=8
+            timeout=8,
+            label='weather_location'
         )
         
         if response.status_code == 200:
@@ -1066,54 +975,34 @@ def extract_location_from_weather_query(query):
 
 def get_web_url_for_app(app_name):
     """AI-powered web URL generation for applications not found locally"""
-    prompt = f"""
-    User wants to open "{app_name}" but it's not installed on their device.
-    Provide the EXACT web URL to open this application/platform in a browser.
-    
-    App/Platform: "{app_name}"
-    
-    Respond with ONLY the URL, no explanations.
-    
-    Examples:
-    - "Facebook" → https://www.facebook.com
-    - "Spotify" → https://open.spotify.com
-    - "Google Cloud" → https://console.cloud.google.com
-    - "Instagram" → https://www.instagram.com
-    - "Twitter" → https://twitter.com
-    - "LinkedIn" → https://www.linkedin.com
-    - "Discord" → https://discord.com/app
-    - "Slack" → https://slack.com/signin
-    - "Notion" → https://www.notion.so
-    - "Figma" → https://www.figma.com
-    
-    URL:"""
+    # Each app is looked up once - later opens use the learned URL (or the remembered miss)
+    known = learned_urls.lookup(app_name)
+    if known is not None:
+        print(f"📚 Learned web URL for '{app_name}': {known or 'none'}")
+        return known or None
     
+    print(f"🤖 AI generating web URL for: {app_name}")
     try:
-        response = requests.post(
-            "https://api.mistral.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {MISTRAL_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
+        response = http_client.mistral_chat(
+            payload={
                 "model": "mistral-large-latest",
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": PROMPTS.messages('web_url', app_name=app_name),
                 "max_tokens": 50,
                 "temperature": 0.1
             },
-            timeout=8
+            timeout=8,
+            label='web_url'
         )
         
         if response.status_code == 200:
             result = response.json()
-            url = result['choices'][0]['message']['content'].strip()
-            # Clean the URL if it has extra text
-            if 'http' in url:
-                # Extract just the URL part
-                import re
-                url_match = re.search(r'https?://[^\s]+', url)
-                if url_match:
-                    return url_match.group(0)
+            # Only a well-formed public URL is kept; anything else is remembered as a miss
+            url = validate_web_url(result['choices'][0]['message']['content'])
+            if url:
+                learned_urls.learn(app_name, url)
+                app_registry.add_web_app(app_name, url)
+            else:
+                learned_urls.mark_unresolved(app_name)
             return url
         else:
             return None
@@ -1122,323 +1011,98 @@ def get_web_url_for_app(app_name):
         print(f"AI URL generation timeout - using fallback")
         return None
 
+def open_in_safari(url):
+    """Open a URL in a new Safari tab and bring Safari to the front"""
+    webbrowser.get('safari').open_new_tab(url)
+    time.sleep(1)
+    os.system("osascript -e 'tell application \"Safari\" to activate'")
+
 def open_application(app_name):
     """Enhanced application opening with intelligent web fallback"""
-    # User's local applications - prioritize these over web versions
-    app_mappings = {
-        # System apps
-        'safari': 'Safari',
-        'chrome': 'Google Chrome',
-        'firefox': 'Firefox',
-        'terminal': 'Terminal',
-        'finder': 'Finder',
-        'calculator': 'Calculator',
-        'calendar': 'Calendar',
-        'notes': 'Notes',
-        'music': 'Music',
-        'mail': 'Mail',
-        'messages': 'Messages',
-        
-        # User's installed applications (LOCAL PRIORITY) - Made more specific
-        'chatgpt': 'ChatGPT',
-        'chat gpt': 'ChatGPT',
-        'chatgpt app': 'ChatGPT',
-        'gemini': 'Gemini',
-        'google gemini': 'Gemini',
-        'gemini app': 'Gemini',
-        'cursor': 'Cursor',
-        'cursor ai': 'Cursor',
-        'gmail': 'Gmail',
-        'microsoft word': 'Microsoft Word',
-        'ms word': 'Microsoft Word',
-        'metamask': 'MetaMask',
-        'meta mask': 'MetaMask',
-        'notebooklm': 'NotebookLM',
-        'notebook lm': 'NotebookLM',
-        'docker': 'Docker',
-        'capcut': 'CapCut',
-        'cap cut': 'CapCut',
-        'grok': 'Grok',
-        'grok ai': 'Grok',
-        'groq': 'Grok',
-        'grog': 'Grok',
-        
-        # College/Education specific - EXACT MATCH REQUIRED
-        'mit ams': 'WEB_AMS',  # Special marker for MIT AMS
-        'ams': 'WEB_AMS',  # Only when context suggests college
-        
-        # Other common apps
-        'youtube': 'YouTube',
-        'whatsapp': 'WhatsApp',
-        'vscode': 'Visual Studio Code',
-        'code': 'Visual Studio Code',
-        'spotify': 'Spotify',
-        'zoom': 'Zoom'
-    }
-    
-    # Direct web URL mappings for apps NOT installed locally
-    # Note: User's local apps (ChatGPT, Gemini, Cursor, etc.) are excluded from web URLs
-    web_app_urls = {
-        'facebook': 'https://www.facebook.com',
-        'instagram': 'https://www.instagram.com',
-        'twitter': 'https://twitter.com',
-        'linkedin': 'https://www.linkedin.com',
-        'discord': 'https://discord.com/app',
-        'slack': 'https://slack.com/signin',
-        'notion': 'https://www.notion.so',
-        'figma': 'https://www.figma.com',
-        'github': 'https://github.com',
-        'dropbox': 'https://www.dropbox.com',
-        'trello': 'https://trello.com',
-        'google cloud': 'https://console.cloud.google.com',
-        'google cloud platform': 'https://console.cloud.google.com',
-        'booking': 'https://www.booking.com',
-        'booking.com': 'https://www.booking.com',
-        'spotify': 'https://open.spotify.com',
-        'mit': 'https://www.mit.edu',
-        'mit AMS': 'https://ams.mit.edu.au/Login/Index?ReturnUrl=%2fStudent%2fDashboard', 
-        'moodle': 'https://moodle.mit.edu.au/login/index.php'
-        # Removed: spotify, chatgpt, gemini, cursor, gmail, docker - these are installed locally
-    }
-    
-    app_name_lower = app_name.lower().strip()
+    # One indexed lookup against the app catalog - see app_registry.py
+    app, how = app_registry.resolve(app_name)
+    if app is not None:
+        print(f"🎯 {how.capitalize()} match found: '{app_name}' → '{app.name}'")
+    display_name = app.name if app is not None else app_name
     
     try:
-        # Special handling for YouTube with multiple app attempts
-        if 'youtube' in app_name_lower:
-            youtube_apps = ['YouTube', 'Friendly Streaming', 'YouTube TV']
-            for youtube_app in youtube_apps:
-                try:
-                    subprocess.run(['open', '-a', youtube_app], check=True)
-                    return True, f"Opened {youtube_app}"
-                except subprocess.CalledProcessError:
-                    continue
-            # Fallback to Safari
-            webbrowser.get('safari').open_new_tab('https://www.youtube.com')
-            os.system("osascript -e 'tell application \"Safari\" to activate'")
-            return True, "Opened YouTube in Safari"
-        
-        # Special handling for Gmail with direct app attempt first
-        elif 'gmail' in app_name_lower:
-            # Try to open Gmail as a direct app first (Add to Dock apps)
-            gmail_app_attempts = ['Gmail', 'Gmail - Google', 'Mail']
-            
-            for gmail_app in gmail_app_attempts:
-                try:
-                    subprocess.run(['open', '-a', gmail_app], check=True)
-                    return True, f"Opened {gmail_app}"
-                except subprocess.CalledProcessError:
-                    continue
-            
-            # If no direct app found, open in Safari (fallback)
-            webbrowser.get('safari').open_new_tab('https://mail.google.com/mail/u/0/#inbox')
-            os.system("osascript -e 'tell application \"Safari\" to activate'")
-            return True, "Opened Gmail in Safari"
-        
-        # Regular app opening for other applications
-        else:
-            # Smart matching for user's local apps with multiple name variations
-            target_app = None
-            
-            # Enhanced matching for local apps - EXACT MATCH FIRST
-            for key, value in app_mappings.items():
-                if key == app_name_lower:  # Exact match first
-                    target_app = value
-                    print(f"🎯 Exact match found: '{app_name}' → '{target_app}'")
-                    break
-            
-            # If no exact match, try contains matching but exclude problematic cases
-            if not target_app:
-                for key, value in app_mappings.items():
-                    if key in app_name_lower and key != 'mit':  # Avoid "mit" matching in "mit ams"
-                        # Special case: Don't match "word" if it's part of "mit ams" context
-                        if key == 'word' and ('mit' in app_name_lower or 'ams' in app_name_lower):
-                            continue
-                        # CRITICAL FIX: Don't match "ai" alone - it's too generic
-                        if key == 'ai' or key == 'openai':
-                            # Only match if it's a clear app opening request, not information request
-                            if not any(info_word in app_name_lower for info_word in ['news', 'about', 'information', 'latest', 'find', 'search']):
-                                target_app = value
-                                print(f"🎯 Contains match found: '{app_name}' → '{target_app}'")
-                                break
-                        else:
-                            target_app = value
-                            print(f"🎯 Contains match found: '{app_name}' → '{target_app}'")
-                            break
-            
-            # If no contains match, try partial matching for compound names (more careful)
-            if not target_app:
-                for key, value in app_mappings.items():
-                    key_words = key.split()
-                    app_words = app_name_lower.split()
-                    
-                    # Avoid matching "mit" alone when user says "mit ams"
-                    if key == 'word' and any(word in ['mit', 'ams'] for word in app_words):
-                        continue
-                        
-                    if any(word in app_words for word in key_words):
-                        target_app = value
-                        print(f"🎯 Partial match found: '{app_name}' → '{target_app}'")
-                        break
-            
-            # Handle special WEB_AMS marker
-            if target_app == 'WEB_AMS':
-                print(f"🎓 Opening MIT AMS in web browser")
-                webbrowser.get('safari').open_new_tab('https://ams.mit.edu.au/Login/Index?ReturnUrl=%2fStudent%2fDashboard')
-                time.sleep(1)
-                os.system("osascript -e 'tell application \"Safari\" to activate'")
-                return True, "Opened MIT AMS in Safari"
-            
-            # Fallback to title case
-            if not target_app:
-                target_app = app_name.title()
-            
-            # Try to open the local application first
+        # Web-only entries (e.g. MIT AMS) skip the local app attempt
+        if app is not None and app.web_only:
+            print(f"🌐 Opening {app.name} in web browser")
+            open_in_safari(app.web)
+            return True, f"Opened {app.name} in Safari"
+        
+        # Try the local application first - every known app name in order, else the title-cased name
+        candidates = app.apps if app is not None else [app_name.title()]
+        installed = app_inventory.find(candidates)
+        if installed is not None:
+            target_app, launch_target = installed
+            try:
+                app_inventory.launch(launch_target)
+                print(f"✅ Successfully opened local app: {target_app}")
+                return True, f"Opened {target_app}"
+            except (subprocess.CalledProcessError, OSError):
+                print(f"⚠️ '{target_app}' is in the app inventory but didn't launch")
+        
+        # A miss still gets one `open -a` pass - LaunchServices finds apps the inventory can't see
+        # (vendor subfolders, /System/Library/CoreServices). Only the name that just failed is skipped
+        if installed is None:
+            app_inventory.is_current()  # Rescans a stale index in the background for next time
+        failed_app = installed[0].lower() if installed is not None else None
+        for target_app in candidates:
+            if target_app.lower() == failed_app:
+                continue
             try:
                 subprocess.run(['open', '-a', target_app], check=True)
                 print(f"✅ Successfully opened local app: {target_app}")
                 return True, f"Opened {target_app}"
             except subprocess.CalledProcessError:
-                # App not found locally - try web version ONLY if not in user's local app list
-                print(f"📱 App '{app_name}' not found locally, checking web version...")
-                
-                # Check if this is one of user's local apps that should NOT open in browser
-                user_local_apps = ['chatgpt', 'openai', 'chat gpt', 'open ai', 'gemini', 'google ai', 
-                                 'cursor', 'cursor ai', 'gmail', 'microsoft word', 'word', 'metamask', 
-                                 'notebooklm', 'notebook lm', 'docker', 'capcut', 'cap cut']
-                
-                is_local_app = any(local_app in app_name_lower for local_app in user_local_apps)
-                
-                if is_local_app:
-                    print(f"⚠️ '{app_name}' should be installed locally but wasn't found")
-                    return False, f"Could not find {app_name}. Please check if it's installed correctly."
-                
-                # For non-local apps, try web version
-                web_url = None
-                for web_app, url in web_app_urls.items():
-                    if web_app in app_name_lower:
-                        web_url = url
-                        break
-                
-                # If no direct mapping, use AI to get the URL
-                if not web_url:
-                    print(f"🤖 AI generating web URL for: {app_name}")
-                    web_url = get_web_url_for_app(app_name)
-                
-                if web_url:
-                    print(f"🌐 Opening web version: {web_url}")
-                    webbrowser.get('safari').open_new_tab(web_url)
-                    time.sleep(1)
-                    os.system("osascript -e 'tell application \"Safari\" to activate'")
-                    return True, f"Opened {app_name} in Safari"
-                else:
-                    return False, f"Could not find {app_name} locally or generate web URL"
+                continue
+        
+        # App not found locally - try web version ONLY if it isn't one of the user's local apps
+        print(f"📱 App '{app_name}' not found locally, checking web version...")
+        if app is not None and app.local_only:
+            print(f"⚠️ '{app_name}' should be installed locally but wasn't found")
+            return False, f"Could not find {app_name}. Please check if it's installed correctly."
+        
+        web_url = app.web if app is not None else None
+        
+        # If no direct mapping, use AI to get the URL
+        if not web_url:
+            web_url = get_web_url_for_app(app_name)
+        
+        if web_url:
+            print(f"🌐 Opening web version: {web_url}")
+            open_in_safari(web_url)
+            return True, f"Opened {display_name} in Safari"
+        else:
+            return False, f"Could not find {app_name} locally or generate web URL"
         
     except Exception as e:
         return False, f"Error opening {app_name}: {e}"
 
 def close_application(app_name):
     """Close specific applications by name with enhanced local app support"""
-    app_mappings = {
-        # System apps
-        'safari': 'Safari',
-        'chrome': 'Google Chrome',
-        'firefox': 'Firefox',
-        'terminal': 'Terminal',
-        'finder': 'Finder',
-        'calculator': 'Calculator',
-        'calendar': 'Calendar',
-        'notes': 'Notes',
-        'music': 'Music',
-        'mail': 'Mail',  # Built-in Mail app
-        'messages': 'Messages',
-        
-        # User's installed applications (LOCAL PRIORITY)
-        'chatgpt': 'ChatGPT',
-        'chat gpt': 'ChatGPT',
-        'chat gbt': 'ChatGPT',
-        'jet gpt': 'ChatGPT',
-        'gpt': 'ChatGPT',
-        'openai': 'ChatGPT',
-        'open ai': 'ChatGPT',
-        'gemini': 'Gemini',
-        'google ai': 'Gemini',
-        'google gemini': 'Gemini',
-        'cursor': 'Cursor',
-        'cursor ai': 'Cursor',
-        'gmail': 'Gmail',  # Gmail app (installed separately)
-        'g mail': 'Gmail',
-        'google mail': 'Gmail',
-        'microsoft word': 'Microsoft Word',
-        'word': 'Microsoft Word',
-        'ms word': 'Microsoft Word',
-        'metamask': 'MetaMask',
-        'meta mask': 'MetaMask',
-        'notebookllm': 'NotebookLLM',
-        'notebook llm': 'NotebookLLM',
-        'docker': 'Docker',
-        'capcut': 'CapCut',
-        'cap cut': 'CapCut',
-        
-        # Other common apps
-        'youtube': ['YouTube', 'Friendly Streaming', 'YouTube TV'],
-        'whatsapp': 'WhatsApp',
-        'vscode': 'Visual Studio Code',
-        'code': 'Visual Studio Code',
-        'spotify': 'Spotify',
-        'zoom': 'Zoom'
-    }
-    
-    app_name_lower = app_name.lower().strip()
+    # Same catalog lookup as opening
+    app, how = app_registry.resolve(app_name)
+    if app is not None:
+        print(f"🎯 {how.capitalize()} match found to close: '{app_name}' → '{app.name}'")
     
     try:
-        if 'youtube' in app_name_lower:
-            # Try to close all possible YouTube apps
-            youtube_apps = ['YouTube', 'Friendly Streaming', 'YouTube TV']
-            for youtube_app in youtube_apps:
-                os.system(f"osascript -e 'quit app \"{youtube_app}\"'")
-            return True, "Closed YouTube applications"
-        
-        # Smart matching for local apps (same logic as opening)
-        target_app = None
-        
-        # Enhanced matching for local apps - EXACT MATCH FIRST
-        for key, value in app_mappings.items():
-            if isinstance(value, list):
-                continue  # Skip YouTube (handled above)
-            if key == app_name_lower:  # Exact match first
-                target_app = value
-                print(f"🎯 Exact match found to close: '{app_name}' → '{target_app}'")
-                break
-        
-        # If no exact match, try contains matching
-        if not target_app:
-            for key, value in app_mappings.items():
-                if isinstance(value, list):
-                    continue  # Skip YouTube (handled above)
-                if key in app_name_lower and key != 'mail':  # Don't match 'mail' for 'gmail'
-                    target_app = value
-                    print(f"🎯 Contains match found to close: '{app_name}' → '{target_app}'")
-                    break
-        
-        # If no exact match, try partial matching for compound names
-        if not target_app:
-            for key, value in app_mappings.items():
-                if isinstance(value, list):
-                    continue  # Skip YouTube
-                if any(word in app_name_lower for word in key.split()):
-                    target_app = value
-                    print(f"🎯 Partial match found to close: '{app_name}' → '{target_app}'")
-                    break
-        
-        # Fallback to title case
-        if not target_app:
-            target_app = app_name.title()
+        if app is None:
+            targets = [app_name.title()]
+        elif app.quit_all:
+            # e.g. YouTube - quit every app it might be running as
+            targets = app.apps
+        else:
+            targets = app.apps[:1]
         
         # Close the application
-        os.system(f"osascript -e 'quit app \"{target_app}\"'")
-        print(f"✅ Successfully closed: {target_app}")
-        return True, f"Closed {target_app}"
+        for target_app in targets:
+            os.system(f"osascript -e 'quit app \"{target_app}\"'")
+        closed = app.name if app is not None else targets[0]
+        print(f"✅ Successfully closed: {closed}")
+        return True, f"Closed {closed}"
         
     except Exception as e:
         return False, f"Error closing {app_name}: {e}"
@@ -1597,85 +1261,13 @@ def execute_system_command(command_type, query, ai_handler):
         location_query = extract_location_from_weather_query(query)
         
         if location_query:
-            try:
-                # Get coordinates for the location using AI
-                coords = get_location_coordinates(location_query)
-                
-                if coords:
-                    lat, lon = coords
-                    # Use Open-Meteo API for accurate weather data
-                    weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,rain,weather_code&timezone=auto"
-                    
-                    response = requests.get(weather_url, timeout=10)
-                    weather_data = response.json()
-                    
-                    current = weather_data['current']
-                    temperature = current['temperature_2m']
-                    feels_like = current['apparent_temperature']
-                    humidity = current['relative_humidity_2m']
-                    precipitation = current['precipitation']
-                    
-                    # Create detailed weather response
-                    weather_response = f"In {location_query}, it's {temperature}°C and feels like {feels_like}°C. Humidity is {humidity}%"
-                    
-                    if precipitation > 0:
-                        weather_response += f" with {precipitation}mm of precipitation"
-                    
-                    weather_response += " sir."
-                    
-                    speak(weather_response)
-                    log_conversation(f"Weather in {location_query}", weather_response)
-                else:
-                    error_response = f"I couldn't find the location {location_query}. Could you try a different location sir?"
-                    speak(error_response)
-                    log_conversation(f"Weather error: {location_query}", error_response)
-                    
-            except Exception as e:
-                print(f"Weather API error: {e}")
-                error_response = "I'm having trouble getting the weather information sir. Please try again."
-                speak(error_response)
-                log_conversation(query, error_response)
+            report_weather(location_query, query)
         else:
             # Fallback: ask for location if not found in query
             speak("Which area would you like me to check sir?")
-            result = recognition()
-            if result[0] is not None:
-                fallback_location, _ = result
-                try:
-                    coords = get_location_coordinates(fallback_location)
-                    
-                    if coords:
-                        lat, lon = coords
-                        weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,rain,weather_code&timezone=auto"
-                        
-                        response = requests.get(weather_url, timeout=10)
-                        weather_data = response.json()
-                        
-                        current = weather_data['current']
-                        temperature = current['temperature_2m']
-                        feels_like = current['apparent_temperature']
-                        humidity = current['relative_humidity_2m']
-                        precipitation = current['precipitation']
-                        
-                        weather_response = f"In {fallback_location}, it's {temperature}°C and feels like {feels_like}°C. Humidity is {humidity}%"
-                        
-                        if precipitation > 0:
-                            weather_response += f" with {precipitation}mm of precipitation"
-                        
-                        weather_response += " sir."
-                        
-                        speak(weather_response)
-                        log_conversation(f"Weather in {fallback_location}", weather_response)
-                    else:
-                        error_response = f"I couldn't find the location {fallback_location}. Could you try a different location sir?"
-                        speak(error_response)
-                        log_conversation(f"Weather error: {fallback_location}", error_response)
-                        
-                except Exception as e:
-                    print(f"Weather API error: {e}")
-                    error_response = "I'm having trouble getting the weather information sir. Please try again."
-                    speak(error_response)
-                    log_conversation(query, error_response)
+            utterance = recognition()
+            if utterance is not None:
+                report_weather(utterance.text, query)
     
     elif command_type == 'goodbye':
         response = "See you next time sir. Have a great day!"
@@ -1688,156 +1280,313 @@ def execute_system_command(command_type, query, ai_handler):
 class OptimizedSyraHandler(EdithAIHandler):
     """Optimized version of AI handler with speed improvements and casual personality"""
     
-    def __init__(self, api_key):
-        super().__init__(api_key)
+    # Quick casual responses for simple interactions
+    CASUAL_RESPONSES = {
+        'hello': "Hey boss! What's up?",
+        'hi': "Hi there! What can I do for ya?",
+        'hey': "Hey! What's going on?",
+        'good day': "Morning boss! Ready to get stuff done?",
+        'good evening': "Evening! How's it going?",
+        'good night': "Night boss! Sleep well!",
+        'how are you': "I'm doing great! Just vibing and ready to help. How about you?",
+        'whats up': "Just chilling and ready to help! What do you need?",
+        'sup': "Not much! Just waiting for you to give me something cool to do!",
+        'thanks': "No worries boss! Happy to help anytime!",
+        'thank you': "You got it! That's what I'm here for!",
+        'nice': "Right? Glad we're on the same page!",
+        'cool': "Yeah! Pretty sweet, right?",
+        'awesome': "I know, right? Always here when you need me!",
+    }
+    
+    def __init__(self, api_key, memory=None, answers=None):
+        super().__init__(api_key, memory, answers)
         self.mistral_config.max_tokens = 120  # Even shorter for speed
         self.mistral_config.temperature = 0.5  # More consistent responses
+        self.command_first = True  # Only pay for chat completions on conversational turns
+        self.streaming = True  # Start speaking on the first sentence of the reply
     
     def get_ai_response(self, user_input, language='en'):
         """Optimized AI response with speed improvements and casual vibes"""
-        
-        # Quick casual responses for simple interactions
-        casual_responses = {
-            'hello': "Hey boss! What's up?",
-            'hi': "Hi there! What can I do for ya?",
-            'hey': "Hey! What's going on?",
-            'good day': "Morning boss! Ready to get stuff done?",
-            'good evening': "Evening! How's it going?",
-            'good night': "Night boss! Sleep well!",
-            'how are you': "I'm doing great! Just vibing and ready to help. How about you?",
-            'whats up': "Just chilling and ready to help! What do you need?",
-            'sup': "Not much! Just waiting for you to give me something cool to do!",
-            'thanks': "No worries boss! Happy to help anytime!",
-            'thank you': "You got it! That's what I'm here for!",
-            'nice': "Right? Glad we're on the same page!",
-            'cool': "Yeah! Pretty sweet, right?",
-            'awesome': "I know, right? Always here when you need me!",
-        }
+        utterance = as_utterance(user_input, language)
+        english_input = utterance.translate(self.translator)
         
         # Check for quick casual responses first
-        user_lower = user_input.lower().strip()
-        for trigger, response in casual_responses.items():
+        user_lower = english_input.lower().strip()
+        for trigger, response in self.CASUAL_RESPONSES.items():
             if trigger in user_lower and len(user_lower.split()) <= 5:
+                self.memory.add_turn(english_input, response)
                 return {
                     'ai_response': response,
-                    'system_command': self.detect_system_command(user_input),
-                    'original_query': user_input,
-                    'english_query': user_input
+                    'system_command': self.detect_system_command(english_input),
+                    'original_query': utterance.text,
+                    'english_query': english_input
                 }
         
         # For longer queries, use the full AI system
-        return super().get_ai_response(user_input, language)
+        return super().get_ai_response(utterance)
 
-def main():
+# Welcome message - More casual and friendly
+WELCOME_MESSAGES = [
+    "Hey boss! SYRA here and ready to roll. What's up?",
+    "What's good boss! I'm all set to help with searches, apps, or just chat. What do you need?",
+    "Hey there! Your AI buddy SYRA is online and ready. What can we get done today?",
+    "Good day boss! Saira here and pumped to help. What's the plan?",
+    "Yo! SYRA back in action. Ready to search stuff, control apps, or just vibe. What's going on?"
+]
+
+DISENGAGEMENT_FAREWELLS = [
+    "No worries, let's take a break. Feel free to call me anytime you need assistance. Have a great day sir!",
+    "Alright, I'm here whenever you need me. Just say the word and I'll be ready to help. Take care sir!",
+    "Got it, I'll be right here when you need me. Don't hesitate to call on me again. Have a good one sir!"
+]
+
+# Fixed utterances synthesized into the TTS cache at startup
+FIXED_PHRASES = (
+    WELCOME_MESSAGES
+    + DISENGAGEMENT_FAREWELLS
+    + TimeoutManager.FAREWELL_MESSAGES
+    + list(OptimizedSyraHandler.CASUAL_RESPONSES.values())
+    + [
+        TimeoutManager.FIRST_TIMEOUT_RESPONSE,
+        "Are you still there sir? Is there anything I can help you with?",
+        "See you next time sir. Have a great day!",
+        "I had trouble opening that application sir.",
+        "I had trouble closing that application sir.",
+        "I had trouble searching sir. Let me open Safari for you.",
+        "I'll open Safari for you sir. What would you like me to search for?",
+        "Which area would you like me to check sir?",
+        "I'm having trouble getting the weather information sir. Please try again.",
+    ]
+)
+FIXED_PHRASE_TEXTS = {clean_markdown_response(phrase) for phrase in FIXED_PHRASES}
+
+def wait_for_clap():
+    """Block until a clap wakes SYRA, then hand the detector's open stream to speech recognition"""
+    from clap import ClapWakeTrigger
+    
+    trigger = ClapWakeTrigger().start()
+    atexit.register(trigger.stop)
+    print("👏 Clap to wake SYRA...")
+    trigger.wait_for_wake()
+    print("👏 Clap detected - waking up!")
+    return trigger.as_audio_source()
+
+def start_session():
+    """Microphone check, handler initialization and welcome - shared by both turn loops"""
+    # Optional clap-to-wake - the clap stream is reused for listening, not reopened
+    audio_source = wait_for_clap() if '--clap' in sys.argv else None
+    
     # Check microphone permission
-    if not check_microphone_permission():
+    if not check_microphone_permission(audio_source):
         speak("I need microphone access to work properly.")
         sys.exit(1)
     
     # Initialize AI handler
     print("🤖 Initializing SYRA Final Version...")
     try:
-        ai_handler = OptimizedSyraHandler(MISTRAL_API_KEY)
+        ai_handler = OptimizedSyraHandler(MISTRAL_API_KEY, memory=conversation_memory, answers=answer_cache)
         translator = TranslationHandler()
         timeout_manager = TimeoutManager()
         print("✅ SYRA Final Version ready!")
         
+        # Per-prompt token totals and the answer cache hit rate when the session ends
+        atexit.register(lambda: print(usage_tracker.report()))
+        atexit.register(lambda: print(answer_cache.report()))
+        
         # Initialize conversation log
-        with open(CONVERSATION_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"\n{'='*60}\n")
-            f.write(f"SYRA FINAL SESSION: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"{'='*60}\n")
+        conversation_logger.start_session()
             
     except Exception as e:
         print(f"❌ Error initializing SYRA: {e}")
         speak("I'm having trouble starting my system.")
         sys.exit(1)
     
-    # Welcome message - More casual and friendly
-    welcome_messages = [
-        "Hey boss! SYRA here and ready to roll. What's up?",
-        "What's good boss! I'm all set to help with searches, apps, or just chat. What do you need?",
-        "Hey there! Your AI buddy SYRA is online and ready. What can we get done today?",
-        "Good day boss! Saira here and pumped to help. What's the plan?",
-        "Yo! SYRA back in action. Ready to search stuff, control apps, or just vibe. What's going on?"
-    ]
+    # Index installed apps while the welcome plays - reuses the stored index if nothing changed
+    app_inventory.start()
+    
+    # Pre-synthesize the fixed phrases so they play with zero synthesis latency
+    tts_cache.warm_up(sorted(FIXED_PHRASE_TEXTS),
+                      _synthesize_with_gtts, **TTS_VOICE)
     
-    welcome_msg = random.choice(welcome_messages)
+    welcome_msg = random.choice(WELCOME_MESSAGES)
     speak(welcome_msg)
-    log_conversation("SESSION_START", welcome_msg)
+    log_conversation(None, welcome_msg, event='welcome')
+    
+    return ai_handler, translator, timeout_manager
+
+def handle_recognition_timeout(timeout_manager):
+    """Progressive timeout handling - returns True when SYRA should exit"""
+    timeout_manager.increment_failure()
+    
+    # Check if we should exit
+    if timeout_manager.should_exit():
+        timeout_response = timeout_manager.get_timeout_response(conversation_memory.recent(3))
+        speak(timeout_response)
+        log_conversation(None, timeout_response, event='timeout_exit')
+        print("👋 SYRA exiting gracefully due to user inactivity...")
+        return True
+    
+    # Get progressive timeout response
+    timeout_response = timeout_manager.get_timeout_response(conversation_memory.recent(3))
+    speak(timeout_response)
+    return False
+
+def say_disengagement_farewell(query):
+    farewell = random.choice(DISENGAGEMENT_FAREWELLS)
+    speak(farewell)
+    log_conversation(query, farewell)
+    print("👋 SYRA exiting gracefully due to user request...")
+
+def classify_turn(utterance, ai_handler, translator):
+    """Translate if needed and route the turn - returns (processed_query, ai_result)"""
+    # Handle Hindi input - translated once here, the handler reads it from the utterance
+    processed_query = utterance.translate(translator)
+    if utterance.is_translated:
+        print(f"Translated: {processed_query}")
+    
+    # Use the enhanced AI handler's system command detection
+    return processed_query, ai_handler.get_ai_response(utterance)
+
+def run_system_command(query, processed_query, ai_result, ai_handler):
+    """Execute a routed turn - returns True when SYRA should exit"""
+    print(f"🔧 System command: {ai_result['system_command']}")
+    
+    should_exit = execute_system_command(
+        ai_result['system_command'], 
+        processed_query,
+        ai_handler
+    )
+    
+    if not should_exit:
+        # Track system command context too
+        update_conversation_context(query, "System command executed")
+    return should_exit
+
+def speak_reply(query, ai_result, cancel_event=None):
+    """Speak a conversational reply, then log and track it"""
+    if ai_result.get('ai_stream') is not None:
+        # Streaming mode: speak each sentence while the rest is still generating
+        clean_response = speak_stream(ai_result['ai_stream'], cancel_event)
+    else:
+        clean_response = clean_markdown_response(ai_result['ai_response'])
+        speak(clean_response)
+    log_conversation(query, clean_response)
+    # The handler already recorded this exchange in conversation_memory
+    print(f"📝 Context updated: {len(conversation_memory)} exchanges tracked")
+
+def main():
+    ai_handler, translator, timeout_manager = start_session()
     
     print("🎙️ SYRA Final is listening... (Enhanced automation)")
     
     while True:
         # Get voice input
-        result = recognition()
-        if result[0] is None:
+        utterance = recognition()
+        if utterance is None:
             # Handle timeout intelligently
-            timeout_manager.increment_failure()
-            
-            # Check if we should exit
-            if timeout_manager.should_exit():
-                timeout_response = timeout_manager.get_timeout_response(conversation_context)
-                speak(timeout_response)
-                log_conversation("TIMEOUT_EXIT", timeout_response)
-                print("👋 SYRA exiting gracefully due to user inactivity...")
+            if handle_recognition_timeout(timeout_manager):
                 break
-            
-            # Get progressive timeout response
-            timeout_response = timeout_manager.get_timeout_response(conversation_context)
-            speak(timeout_response)
             continue
             
-        query, detect_language = result
+        query = utterance.text
         
         # Reset timeout counter on successful recognition
         timeout_manager.reset()
         
         # Check for immediate disengagement signals
         if detect_user_disengagement(query):
-            farewell = ["No worries, let's take a break. Feel free to call me anytime you need assistance. Have a great day sir!",
-                        "Alright, I'm here whenever you need me. Just say the word and I'll be ready to help. Take care sir!",
-                        "Got it, I'll be right here when you need me. Don't hesitate to call on me again. Have a good one sir!"]
-            farewell = random.choice(farewell)
-            speak(farewell)
-            log_conversation(query, farewell)
-            print("👋 SYRA exiting gracefully due to user request...")
+            say_disengagement_farewell(query)
             break
         
-        # Handle Hindi input
-        if detect_language == 'hi':
-            english_query = translator.translate_text(query, src='hi', dest='en')
-            print(f"Translated: {english_query}")
-            processed_query = english_query
-        else:
-            processed_query = query
-        
-        # Use the enhanced AI handler's system command detection
-        ai_result = ai_handler.get_ai_response(processed_query, language='en')
-        
-        # Clean the AI response
-        clean_response = clean_markdown_response(ai_result['ai_response'])
+        processed_query, ai_result = classify_turn(utterance, ai_handler, translator)
         
         # Check if it's a system command using the ENHANCED detection
         if ai_result['system_command']:
-            print(f"🔧 System command: {ai_result['system_command']}")
-            
-            should_exit = execute_system_command(
-                ai_result['system_command'], 
-                processed_query,
-                ai_handler
-            )
-            
-            if should_exit:
+            if run_system_command(query, processed_query, ai_result, ai_handler):
                 break
-            # Track system command context too
-            update_conversation_context(query, "System command executed")
         else:
             # Regular AI conversation
-            speak(clean_response)
-            log_conversation(query, clean_response)
-            # Track conversation context
-            update_conversation_context(query, clean_response)
+            speak_reply(query, ai_result)
+
+async def run_turn_async(utterance, ai_handler, translator):
+    """One turn with the disengagement check overlapping translation and routing.
+
+    Returns (should_exit, speech_task, cancel_event). Conversational replies are spoken
+    in their own task so the caller can start listening again straight away.
+    """
+    query = utterance.text
+    disengage_task = asyncio.create_task(asyncio.to_thread(detect_user_disengagement, query))
+    classify_task = asyncio.create_task(
+        asyncio.to_thread(classify_turn, utterance, ai_handler, translator)
+    )
+    
+    try:
+        disengaged = await disengage_task
+        if disengaged:
+            classify_task.cancel()
+            await asyncio.to_thread(say_disengagement_farewell, query)
+            return True, None, None
+        processed_query, ai_result = await classify_task
+    except asyncio.CancelledError:
+        disengage_task.cancel()
+        classify_task.cancel()
+        raise
+    
+    if ai_result['system_command']:
+        should_exit = await asyncio.to_thread(run_system_command, query, processed_query, ai_result, ai_handler)
+        return should_exit, None, None
+    
+    cancel_event = threading.Event()
+    speech_task = asyncio.create_task(asyncio.to_thread(speak_reply, query, ai_result, cancel_event))
+    return False, speech_task, cancel_event
+
+async def main_async():
+    """asyncio turn pipeline - same routing as main(), with overlapping stages and barge-in"""
+    ai_handler, translator, timeout_manager = start_session()
+    
+    print("🎙️ SYRA Final is listening... (async pipeline)")
+    
+    speech_task = None
+    cancel_event = None
+    
+    while True:
+        # The next listen starts while the previous reply is still being spoken
+        listen_started = time.monotonic()
+        speaking_at_start = (speech_task is not None and not speech_task.done()) or audio_player.is_busy()
+        utterance = await asyncio.to_thread(recognition, False)
+        speaking = (speech_task is not None and not speech_task.done()) or audio_player.is_busy()
+        # Playback overlapped the capture window - even if it ended before recognition returned
+        overlapped = speaking or speaking_at_start or audio_player.last_active >= listen_started
+        
+        if utterance is None:
+            if overlapped:
+                continue  # Silence while SYRA talks isn't an inactivity timeout
+            # The timeout reply may call Mistral and synthesize speech - keep it off the event loop
+            if await asyncio.to_thread(handle_recognition_timeout, timeout_manager):
+                break
+            continue
+        
+        if overlapped and is_echo(utterance.text):
+            continue  # The mic picked up SYRA's own voice
+        
+        if speaking:
+            # Barge-in: the user talked over SYRA - cancel the reply in progress
+            print("✋ Barge-in - stopping current reply")
+            if cancel_event is not None:
+                cancel_event.set()
+            stop_speaking()
+        
+        timeout_manager.reset()
+        
+        should_exit, speech_task, cancel_event = await run_turn_async(utterance, ai_handler, translator)
+        if should_exit:
+            break
+    
+    if speech_task is not None:
+        await speech_task
 
 if __name__ == '__main__':
-    main()
+    if '--async' in sys.argv:
+        asyncio.run(main_async())
+    else:
+        main()
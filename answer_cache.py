@@ -0,0 +1,239 @@
+"""
+Answer cache for SYRA
+Mistral answers keyed by normalized query, with a char n-gram TF-IDF index for reworded repeats and per-intent TTLs
+"""
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from cache_store import JsonFileStore
+
+# Seconds an answer stays valid, by how quickly the underlying facts change
+ANSWER_TTLS = {
+    'live': 15 * 60,            # "latest", "today's", scores, prices, news
+    'recent': 6 * 3600,         # "this week", "recently", "new"
+    'web': 7 * 24 * 3600,       # factual lookups ("who owns tesla")
+    'chat': 24 * 3600,          # self-contained questions answered in conversation
+}
+
+LIVE_WORDS = re.compile(
+    r"\b(?:latest|today'?s?|tonight|now|current(?:ly)?|live|news|headlines?|score|scores|price|prices|stock|stocks"
+    r"|weather|yesterday|tomorrow|trending|breaking)\b"
+)
+RECENT_WORDS = re.compile(r"\b(?:this (?:week|month|year)|recent(?:ly)?|new|newest|upcoming|last (?:week|month))\b")
+
+# Leading filler that doesn't change the question
+FILLER = re.compile(r"^(?:(?:hey|ok(?:ay)?|so|syra|please|can you|could you|tell me|let me know)\s+)+")
+
+# Questions that stand on their own - no reference back to the conversation
+QUESTION_START = re.compile(r"^(?:what|who|whom|whose|which|when|where|why|how|explain|define|tell me about)\b")
+CONTEXT_WORDS = re.compile(r"\b(?:it|its|that|this|these|those|he|him|his|she|her|they|them|their|you|your|me|my|again)\b")
+
+# Words that don't change what is being asked - everything else must match for a similar hit
+STOPWORDS = {
+    'what', 'is', 'are', 'was', 'were', 'who', 'whom', 'whose', 'which', 'how', 'why', 'when', 'where',
+    'the', 'a', 'an', 'of', 'in', 'on', 'at', 'about', 'for', 'to', 'does', 'do', 'did', 'can', 'tell', 'me',
+    'explain', 'define', 'exactly', 'actually', 'really', 'basically', 'please', 'whats', 'us'
+}
+
+NGRAM = 3
+
+
+def normalize_query(text):
+    """Cache key for a question - case, punctuation, contractions and filler don't matter"""
+    text = text.lower().replace("what's", "what is").replace("who's", "who is").replace("where's", "where is")
+    text = re.sub(r"[^\w\s']", ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return FILLER.sub('', text)
+
+
+def freshness(query):
+    """TTL class implied by the wording of a normalized query"""
+    if LIVE_WORDS.search(query):
+        return 'live'
+    if RECENT_WORDS.search(query):
+        return 'recent'
+    return None
+
+
+def is_standalone_question(text):
+    """Chat questions whose answer doesn't depend on earlier turns"""
+    query = normalize_query(text)
+    return bool(QUESTION_START.match(query)) and not CONTEXT_WORDS.search(query)
+
+
+def content_signature(query):
+    """Content words with plurals folded and spacing removed - 'bit coin' and 'bitcoins' agree"""
+    words = [word.rstrip('s') if len(word) > 3 else word
+             for word in query.replace("'", ' ').split() if word not in STOPWORDS]
+    return ''.join(words)
+
+
+def char_ngrams(text):
+    padded = f" {text} "
+    return Counter(padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1))
+
+
+class AnswerCache:
+    def __init__(self, max_entries=500, similarity=0.7, ttls=None, store=None):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self.ttls = dict(ANSWER_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.store = store or JsonFileStore('answers')
+
+        # (scope, key) -> (answer, stored_at, ttl), least recently used first
+        self._entries = OrderedDict()
+        # n-gram -> keys containing it; unit TF-IDF vectors are rebuilt lazily after writes
+        self._postings = {}
+        self._vectors = {}
+        self._dirty = True
+
+        self.hits = Counter()
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, query, scope='web'):
+        """Cached answer for this question or a close rewording of it, or None"""
+        key = normalize_query(query)
+        if not key:
+            return None
+
+        with self._lock:
+            self._expire()
+            entry = self._entries.get((scope, key))
+            if entry is not None:
+                self._entries.move_to_end((scope, key))
+                self.hits['exact'] += 1
+                print(f"💾 Answer cache hit: '{key}'")
+                return entry[0]
+
+            match, score = self._nearest(key, scope)
+            if match is not None:
+                self._entries.move_to_end(match)
+                self.hits['similar'] += 1
+                print(f"💾 Answer cache hit ({score:.2f} like '{match[1]}')")
+                return self._entries[match][0]
+
+            self.misses += 1
+            return None
+
+    def put(self, query, answer, scope='web'):
+        """Remember a successful answer and persist the cache"""
+        key = normalize_query(query)
+        if not key or not answer:
+            return
+
+        ttl = self.ttls[freshness(key) or scope]
+        with self._lock:
+            self._entries.pop((scope, key), None)
+            self._entries[(scope, key)] = (answer, time.time(), ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+            snapshot = [[scope, key, answer, stored_at, ttl]
+                        for (scope, key), (answer, stored_at, ttl) in self._entries.items()]
+        self.store.save({'entries': snapshot})
+
+    def hit_rate(self):
+        lookups = sum(self.hits.values()) + self.misses
+        return sum(self.hits.values()) / lookups if lookups else 0.0
+
+    def report(self):
+        lookups = sum(self.hits.values()) + self.misses
+        return (f"💾 Answer cache: {self.hit_rate():.0%} hit rate over {lookups} lookups "
+                f"({self.hits['exact']} exact, {self.hits['similar']} similar), {len(self._entries)} answers stored")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+        self.store.save({'entries': []})
+
+    def _expire(self):
+        # Caller holds the lock
+        now = time.time()
+        expired = [key for key, (_, stored_at, ttl) in self._entries.items() if now - stored_at >= ttl]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            self._dirty = True
+
+    def _nearest(self, key, scope):
+        """Best cached question in the same scope and freshness class above the similarity bar"""
+        # Caller holds the lock
+        if self._dirty:
+            self._reindex()
+        if not self._vectors:
+            return None, 0.0
+
+        documents = len(self._vectors)
+        query_vector = {}
+        for gram, count in char_ngrams(key).items():
+            # n-grams no cached question has still count against the match - at the rarest weight
+            df = len(self._postings.get(gram, ())) or 1
+            query_vector[gram] = count * math.log(1 + documents / df)
+        norm = math.sqrt(sum(weight * weight for weight in query_vector.values()))
+        if not norm:
+            return None, 0.0
+
+        scores = Counter()
+        for gram, weight in query_vector.items():
+            for entry_key in self._postings.get(gram, ()):
+                scores[entry_key] += weight / norm * self._vectors[entry_key][gram]
+
+        # The n-gram score finds rewordings; the signature stops "capital of chile" matching "capital of china"
+        query_freshness = freshness(key)
+        signature = content_signature(key)
+        for entry_key, score in scores.most_common():
+            if score < self.similarity:
+                break
+            if (entry_key[0] == scope and freshness(entry_key[1]) == query_freshness
+                    and content_signature(entry_key[1]) == signature):
+                return entry_key, score
+        return None, 0.0
+
+    def _reindex(self):
+        # Caller holds the lock
+        grams = {entry_key: char_ngrams(entry_key[1]) for entry_key in self._entries}
+        self._postings = {}
+        for entry_key, counts in grams.items():
+            for gram in counts:
+                self._postings.setdefault(gram, set()).add(entry_key)
+
+        documents = len(grams)
+        self._vectors = {}
+        for entry_key, counts in grams.items():
+            vector = {gram: count * math.log(1 + documents / len(self._postings[gram])) for gram, count in counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+            self._vectors[entry_key] = {gram: weight / norm for gram, weight in vector.items()}
+        self._dirty = False
+
+    def _load(self):
+        now = time.time()
+        for entry in self.store.load().get('entries', []):
+            try:
+                scope, key, answer, stored_at, ttl = entry
+            except (TypeError, ValueError):
+                continue
+            if now - stored_at < ttl:
+                self._entries[(scope, key)] = (answer, stored_at, ttl)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_answer_cache():
+    """Process-wide AnswerCache so web search and chat share one index and one file"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = AnswerCache()
+        return _shared_cache
@@ -0,0 +1,86 @@
+"""
+App catalog for SYRA
+The one table of apps and websites SYRA can open or close - app_registry.py indexes it once at import
+"""
+
+MIT_AMS_URL = 'https://ams.mit.edu.au/Login/Index?ReturnUrl=%2fStudent%2fDashboard'
+
+# Canonical name -> how it's reached:
+#   aliases     names users say for it (speech-recognizer spellings included)
+#   apps        macOS app names tried in order with `open -a` (default: the canonical name)
+#   web         URL opened in Safari when no local app is found
+#   local_only  installed locally - never fall back to the browser
+#   web_only    always opened in the browser
+#   quit_all    closing quits every name in 'apps', not just the first
+APP_CATALOG = {
+    # System apps
+    'Safari': {'aliases': ['safari']},
+    'Google Chrome': {'aliases': ['chrome', 'google chrome']},
+    'Firefox': {'aliases': ['firefox']},
+    'Terminal': {'aliases': ['terminal']},
+    'Finder': {'aliases': ['finder']},
+    'Calculator': {'aliases': ['calculator']},
+    'Calendar': {'aliases': ['calendar']},
+    'Notes': {'aliases': ['notes']},
+    'Music': {'aliases': ['music']},
+    'Mail': {'aliases': ['mail']},
+    'Messages': {'aliases': ['messages']},
+
+    # User's installed applications (LOCAL PRIORITY)
+    'ChatGPT': {
+        'aliases': ['chatgpt', 'chat gpt', 'chat gbt', 'jet gpt', 'gpt', 'chatgpt app', 'openai', 'open ai'],
+        'local_only': True,
+    },
+    'Gemini': {'aliases': ['gemini', 'google gemini', 'gemini app', 'google ai'], 'local_only': True},
+    'Cursor': {'aliases': ['cursor', 'cursor ai'], 'local_only': True},
+    'Gmail': {
+        # "Add to Dock" web apps first, then the built-in Mail app, then the browser
+        'aliases': ['gmail', 'g mail', 'google mail'],
+        'apps': ['Gmail', 'Gmail - Google', 'Mail'],
+        'web': 'https://mail.google.com/mail/u/0/#inbox',
+    },
+    'Microsoft Word': {'aliases': ['microsoft word', 'ms word', 'word'], 'local_only': True},
+    'MetaMask': {'aliases': ['metamask', 'meta mask'], 'local_only': True},
+    'NotebookLM': {'aliases': ['notebooklm', 'notebook lm', 'notebookllm', 'notebook llm'], 'local_only': True},
+    'Docker': {'aliases': ['docker'], 'local_only': True},
+    'CapCut': {'aliases': ['capcut', 'cap cut'], 'local_only': True},
+    'Grok': {'aliases': ['grok', 'grok ai', 'groq', 'grog']},
+
+    # College/Education specific
+    'MIT AMS': {'aliases': ['mit ams', 'ams'], 'web': MIT_AMS_URL, 'web_only': True},
+    'MIT': {'aliases': ['mit'], 'web': 'https://www.mit.edu'},
+    'Moodle': {'aliases': ['moodle'], 'web': 'https://moodle.mit.edu.au/login/index.php'},
+
+    # Other common apps
+    'YouTube': {
+        'aliases': ['youtube'],
+        'apps': ['YouTube', 'Friendly Streaming', 'YouTube TV'],
+        'web': 'https://www.youtube.com',
+        'quit_all': True,
+    },
+    'WhatsApp': {'aliases': ['whatsapp']},
+    'Visual Studio Code': {'aliases': ['vscode', 'vs code', 'visual studio code', 'code']},
+    'Spotify': {'aliases': ['spotify'], 'web': 'https://open.spotify.com'},
+    'Zoom': {'aliases': ['zoom']},
+
+    # Websites for apps NOT installed locally
+    'Facebook': {'aliases': ['facebook'], 'web': 'https://www.facebook.com'},
+    'Instagram': {'aliases': ['instagram'], 'web': 'https://www.instagram.com'},
+    'Twitter': {'aliases': ['twitter'], 'web': 'https://twitter.com'},
+    'LinkedIn': {'aliases': ['linkedin'], 'web': 'https://www.linkedin.com'},
+    'Discord': {'aliases': ['discord'], 'web': 'https://discord.com/app'},
+    'Slack': {'aliases': ['slack'], 'web': 'https://slack.com/signin'},
+    'Notion': {'aliases': ['notion'], 'web': 'https://www.notion.so'},
+    'Figma': {'aliases': ['figma'], 'web': 'https://www.figma.com'},
+    'GitHub': {'aliases': ['github', 'git hub'], 'web': 'https://github.com'},
+    'Dropbox': {'aliases': ['dropbox'], 'web': 'https://www.dropbox.com'},
+    'Trello': {'aliases': ['trello'], 'web': 'https://trello.com'},
+    'Google Cloud': {
+        'aliases': ['google cloud', 'google cloud platform'],
+        'web': 'https://console.cloud.google.com',
+    },
+    'Booking.com': {'aliases': ['booking', 'booking.com', 'booking com'], 'web': 'https://www.booking.com'},
+}
+
+# Words that say nothing about which app is meant - never indexed or matched on their own
+GENERIC_APP_WORDS = {'ai', 'app', 'application', 'the', 'my', 'a', 'an', 'please', 'up', 'for', 'me'}
@@ -0,0 +1,177 @@
+"""
+Installed application inventory for SYRA
+Scans the app directories once in the background and answers "is X installed" from memory;
+the index is kept on disk and rescanned only when a directory's mtime changes
+"""
+import configparser
+import os
+import subprocess
+import sys
+import threading
+
+from cache_store import JsonFileStore
+
+
+def default_app_dirs():
+    """Directories that hold launchable apps on this platform"""
+    home = os.path.expanduser('~')
+    if sys.platform == 'darwin':
+        return [
+            '/Applications',
+            '/Applications/Utilities',
+            '/System/Applications',
+            '/System/Applications/Utilities',
+            os.path.join(home, 'Applications'),
+            # "Add to Dock" web apps from Chrome and Safari
+            os.path.join(home, 'Applications', 'Chrome Apps.localized'),
+        ]
+
+    data_home = os.getenv('XDG_DATA_HOME') or os.path.join(home, '.local', 'share')
+    data_dirs = (os.getenv('XDG_DATA_DIRS') or '/usr/local/share:/usr/share').split(':')
+    return [os.path.join(path, 'applications') for path in [data_home] + data_dirs if path] + [
+        '/var/lib/flatpak/exports/share/applications',
+        os.path.join(data_home, 'flatpak', 'exports', 'share', 'applications'),
+    ]
+
+
+def dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def read_desktop_entry(path):
+    """Display name of a launchable .desktop file, or None for hidden and non-application entries"""
+    parser = configparser.RawConfigParser(interpolation=None, strict=False)
+    try:
+        parser.read(path, encoding='utf-8')
+        entry = parser['Desktop Entry']
+    except (configparser.Error, KeyError, UnicodeDecodeError, OSError):
+        return None
+    if entry.get('Type', 'Application') != 'Application':
+        return None
+    if entry.get('NoDisplay', '').lower() == 'true' or entry.get('Hidden', '').lower() == 'true':
+        return None
+    return entry.get('Name')
+
+
+def scan_dir(path):
+    """{lowercase name: [display name, launch target]} for the apps directly inside one directory"""
+    apps = {}
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return apps
+
+    for file_name in names:
+        full_path = os.path.join(path, file_name)
+        if file_name.endswith('.app'):
+            display_name = file_name[:-len('.app')]
+            apps[display_name.lower()] = [display_name, full_path]
+        elif file_name.endswith('.desktop'):
+            display_name = read_desktop_entry(full_path)
+            if display_name:
+                # Both the menu name and the desktop file id launch it
+                apps.setdefault(display_name.lower(), [display_name, full_path])
+                apps.setdefault(file_name[:-len('.desktop')].lower(), [display_name, full_path])
+    return apps
+
+
+class AppInventory:
+    def __init__(self, dirs=None, store=None):
+        self.dirs = dirs or default_app_dirs()
+        self.store = store or JsonFileStore('app_inventory')
+
+        # lowercase name -> (display name, launch target); None until the first scan or load
+        self._apps = None
+        self._mtimes = {}
+        self._scanning = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def ready(self):
+        return self._apps is not None
+
+    def start(self):
+        """Rescan in the background if any app directory changed since the stored index"""
+        if self.ready and not self._stale():
+            print(f"📦 App inventory loaded: {len(self._apps)} apps")
+            return None
+        return self._scan_in_background()
+
+    def find(self, names):
+        """(display name, launch target) of the first installed name, or None"""
+        with self._lock:
+            apps = self._apps or {}
+            for name in names:
+                found = apps.get(name.lower())
+                if found is not None:
+                    return tuple(found)
+        return None
+
+    def is_current(self):
+        """True when a miss in find() really means "not installed".
+        A changed directory triggers a background rescan and reports False until it lands"""
+        if not self.ready:
+            return False
+        if self._stale():
+            self._scan_in_background()
+            return False
+        return True
+
+    def is_installed(self, name):
+        return self.find([name]) is not None
+
+    def launch_command(self, target):
+        """Command that starts the app behind a launch target"""
+        if target.endswith('.desktop'):
+            return ['gtk-launch', os.path.basename(target)[:-len('.desktop')]]
+        return ['open', '-a', target]
+
+    def launch(self, target):
+        subprocess.run(self.launch_command(target), check=True)
+
+    def _stale(self):
+        return any(dir_mtime(path) != self._mtimes.get(path) for path in self.dirs)
+
+    def _scan_in_background(self):
+        with self._lock:
+            if self._scanning:
+                return None
+            self._scanning = True
+
+        thread = threading.Thread(target=self._scan, name="syra-app-inventory", daemon=True)
+        thread.start()
+        return thread
+
+    def _scan(self):
+        try:
+            mtimes = {path: dir_mtime(path) for path in self.dirs}
+            apps = {}
+            # Earlier directories win - /Applications over the system copies
+            for path in reversed(self.dirs):
+                if mtimes[path] is not None:
+                    apps.update(scan_dir(path))
+
+            with self._lock:
+                self._apps = apps
+                self._mtimes = mtimes
+            self.store.save({'dirs': {path: mtime for path, mtime in mtimes.items()}, 'apps': apps})
+            print(f"📦 App inventory scanned: {len(apps)} apps")
+        except Exception as e:
+            print(f"App inventory scan error: {e}")
+        finally:
+            with self._lock:
+                self._scanning = False
+
+    def _load(self):
+        data = self.store.load()
+        apps = data.get('apps')
+        dirs = data.get('dirs')
+        if not isinstance(apps, dict) or not isinstance(dirs, dict) or set(dirs) != set(self.dirs):
+            return
+        self._apps = {name: list(entry) for name, entry in apps.items()
+                      if isinstance(entry, list) and len(entry) == 2}
+        self._mtimes = dirs
@@ -0,0 +1,176 @@
+"""
+App registry for SYRA
+Resolves a spoken app name against the catalog with one exact lookup, a token index and a fuzzy/phonetic fallback
+"""
+import re
+
+from app_catalog import APP_CATALOG, GENERIC_APP_WORDS
+
+SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'), **dict.fromkeys('dt', '3'),
+    'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+}
+
+
+def normalize_app_name(name):
+    """Lowercase words without punctuation - 'Booking.com' and 'booking com' agree"""
+    return ' '.join(re.findall(r'[a-z0-9]+', name.lower()))
+
+
+def phonetic_key(word):
+    """American Soundex - 'grog', 'grok' and 'groq' share G620"""
+    if not word:
+        return ''
+    key = word[0]
+    previous = SOUNDEX_CODES.get(word[0], '')
+    for char in word[1:]:
+        code = SOUNDEX_CODES.get(char, '')
+        if code and code != previous:
+            key += code
+        if char not in 'hw':
+            previous = code
+    return (key + '000')[:4]
+
+
+def edit_distance(a, b, limit=2):
+    """Levenshtein distance, or limit + 1 as soon as it's known to exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    row = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        best = row[0]
+        for j, char_b in enumerate(b, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (char_a != char_b))
+            best = min(best, row[j])
+        if best > limit:
+            return limit + 1
+    return row[-1]
+
+
+class AppEntry:
+    def __init__(self, name, aliases, apps=None, web=None, local_only=False, web_only=False, quit_all=False):
+        self.name = name
+        self.aliases = aliases
+        self.apps = apps or [name]
+        self.web = web
+        self.local_only = local_only
+        self.web_only = web_only
+        self.quit_all = quit_all
+
+    def __repr__(self):
+        return f"AppEntry({self.name!r})"
+
+
+class AppRegistry:
+    def __init__(self, catalog=APP_CATALOG):
+        self.entries = []
+        # Normalized alias (and its spaceless form) -> entry; first entry in catalog order wins
+        self.exact = {}
+        # Word -> (alias words, entry) for every alias containing it
+        self.tokens = {}
+        for name, spec in catalog.items():
+            self._index(AppEntry(name, **spec))
+        self._index_words()
+
+    def add_web_app(self, app_name, url):
+        """Merge a learned website into the index - the catalog's own entries keep priority"""
+        entry, how = self.resolve(app_name)
+        if how == 'exact':
+            if entry.web is None and not entry.local_only:
+                entry.web = url
+            return entry
+
+        # Indexed for exact and whole-phrase matches only - distinctive words stay computed over the
+        # catalog, so learning "chrome remote desktop" can't stop "chrom" resolving to Chrome
+        entry = AppEntry(app_name.title(), [normalize_app_name(app_name)], web=url)
+        self._index(entry)
+        return entry
+
+    def _index(self, entry):
+        self.entries.append(entry)
+        for alias in entry.aliases:
+            words = tuple(normalize_app_name(alias).split())
+            self.exact.setdefault(' '.join(words), entry)
+            self.exact.setdefault(''.join(words), entry)
+            for word in words:
+                self.tokens.setdefault(word, []).append((words, entry))
+
+    def _index_words(self):
+        # Words naming exactly one catalog app - only these may match on their own
+        self.distinctive = {
+            word for word, postings in self.tokens.items()
+            if word not in GENERIC_APP_WORDS and len({id(entry) for _, entry in postings}) == 1
+        }
+        self.phonetic = {}
+        for word in self.distinctive:
+            self.phonetic.setdefault(phonetic_key(word), set()).add(word)
+
+    def resolve(self, app_name):
+        """(entry, how) for a spoken app name - how is 'exact', 'contains', 'partial' or 'fuzzy' - or (None, None)"""
+        spoken = normalize_app_name(app_name).split()
+        words = [word for word in spoken if word not in GENERIC_APP_WORDS]
+        if not words:
+            return None, None
+
+        # "chatgpt app" is an alias as said; "the gmail app" only after the filler goes
+        for key in (' '.join(spoken), ''.join(spoken), ' '.join(words), ''.join(words)):
+            if key in self.exact:
+                return self.exact[key], 'exact'
+
+        entry = self._contained_alias(spoken)
+        if entry is not None:
+            return entry, 'contains'
+
+        entry = self._distinctive_word(words)
+        if entry is not None:
+            return entry, 'partial'
+
+        entry = self._fuzzy(words)
+        if entry is not None:
+            return entry, 'fuzzy'
+        return None, None
+
+    def _contained_alias(self, words):
+        """Longest alias appearing as a whole phrase in the name - 'mit ams' beats 'mit'"""
+        padded = f" {' '.join(words)} "
+        best = None
+        for word in dict.fromkeys(words):
+            for alias_words, entry in self.tokens.get(word, ()):
+                if f" {' '.join(alias_words)} " in padded:
+                    rank = (len(alias_words), len(''.join(alias_words)))
+                    if best is None or rank > best[0]:
+                        best = (rank, entry)
+        return best[1] if best else None
+
+    def _distinctive_word(self, words):
+        """A word that belongs to exactly one app's aliases - 'visual studio' → Visual Studio Code"""
+        for word in words:
+            if word in self.distinctive:
+                return self.tokens[word][0][1]
+        return None
+
+    def _fuzzy(self, words):
+        """Closest distinctive word by edit distance, with sound-alike words preferred on ties.
+        The first letter must agree - 'xcode' is not a misheard 'code'"""
+        # "note book" is tried as "notebook" too
+        candidates = words + [''.join(words)] if len(words) > 1 else words
+        best = None
+        for word in candidates:
+            if len(word) < 3:
+                continue
+            limit = 1 if len(word) < 7 else 2
+            sound_alikes = self.phonetic.get(phonetic_key(word), set())
+            for candidate in self.distinctive:
+                if candidate[0] != word[0]:
+                    continue
+                distance = edit_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+                rank = (distance, candidate not in sound_alikes, candidate)
+                if best is None or rank < best[0]:
+                    best = (rank, self.tokens[candidate][0][1])
+        return best[1] if best else None
+
+
+APP_REGISTRY = AppRegistry()
@@ -0,0 +1,116 @@
+"""
+Background audio playback for SYRA
+Plays queued in-memory mp3 buffers on a worker thread so speaking never blocks the turn loop
+"""
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+
+class AudioPlayer:
+    def __init__(self, rate=1.2):
+        self.rate = rate  # Playback speed, only honoured by afplay
+        self._queue = queue.Queue()
+        self._process = None
+        self._process_lock = threading.Lock()
+
+        # Bumped by interrupt() - anything queued under an older generation is dropped
+        self._generation = 0
+        # Monotonic time the last queued buffer finished (or was dropped) - lets callers tell
+        # whether playback overlapped a window that has already ended
+        self.last_active = 0.0
+
+        self._worker = threading.Thread(target=self._run, name="syra-audio", daemon=True)
+        self._worker.start()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def enqueue(self, audio_bytes, generation=None):
+        """Queue an mp3 buffer to play after everything already queued - False if it won't play.
+        Pass the generation read before synthesizing it, so a barge-in during synthesis drops it"""
+        if generation is None:
+            generation = self._generation
+        if not audio_bytes or generation != self._generation:
+            return False
+        self._queue.put((generation, audio_bytes))
+        return True
+
+    def flush(self):
+        """Drop queued audio that hasn't started playing yet"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._queue.task_done()
+
+    def interrupt(self):
+        """Stop the current utterance and drop everything queued behind it (barge-in)"""
+        self._generation += 1
+        self.flush()
+        with self._process_lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.terminate()
+
+    def is_busy(self):
+        return self._queue.unfinished_tasks > 0
+
+    def wait(self):
+        """Block until all queued audio has finished playing"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            generation, audio_bytes = self._queue.get()
+            try:
+                if generation == self._generation:
+                    self._play(audio_bytes, generation)
+            except Exception as e:
+                print(f"Audio playback error: {e}")
+            finally:
+                self.last_active = time.monotonic()
+                self._queue.task_done()
+
+    def _play(self, audio_bytes, generation):
+        # afplay (macOS built-in) supports speed control but only reads files,
+        # so each buffer gets its own temp file - nothing is shared between utterances
+        if shutil.which('afplay'):
+            fd, audio_path = tempfile.mkstemp(prefix='syra_', suffix='.mp3')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(audio_bytes)
+                self._run_process(['afplay', '-r', str(self.rate), audio_path], None, generation)
+            finally:
+                os.remove(audio_path)
+        else:
+            # Fallback to mpg123 without speed control, streaming the buffer on stdin
+            self._run_process(['mpg123', '--quiet', '-'], audio_bytes, generation)
+
+    def _run_process(self, command, stdin_bytes, generation):
+        with self._process_lock:
+            if generation != self._generation:
+                return  # Interrupted while preparing
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE if stdin_bytes is not None else subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            self._process = process
+        try:
+            if stdin_bytes is not None:
+                try:
+                    process.stdin.write(stdin_bytes)
+                    process.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass  # Player was interrupted mid-write
+            process.wait()
+        finally:
+            with self._process_lock:
+                self._process = None
@@ -0,0 +1,40 @@
+"""
+On-disk cache location for SYRA
+All persistent caches live under one directory (SYRA_CACHE_DIR, default .syra_cache)
+"""
+import json
+import os
+
+DEFAULT_CACHE_DIR = ".syra_cache"
+
+
+def get_cache_dir(*parts):
+    """Return (and create) a directory inside the SYRA cache root"""
+    path = os.path.join(os.getenv('SYRA_CACHE_DIR', DEFAULT_CACHE_DIR), *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class JsonFileStore:
+    """A small JSON document in the cache root, rewritten atomically on save"""
+
+    def __init__(self, name, cache_dir=None):
+        self.path = os.path.join(cache_dir or get_cache_dir(), f"{name}.json")
+
+    def load(self):
+        """Return the stored dict, or an empty one if missing or unreadable"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, data):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Cache write error ({os.path.basename(self.path)}): {e}")
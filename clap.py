@@ -1,58 +1,47 @@
+import asyncio
+import threading
+from collections import deque
+
 import pyaudio
-import struct
-import math
+import speech_recognition as sr
+from tap_detector import TapDetector, INPUT_BLOCK_TIME
 
-INITIAL_TAP_THRESHOLD = 0.1
 FORMAT = pyaudio.paInt16 
-SHORT_NORMALIZE = (1.0/32768.0)
 CHANNELS = 1
 RATE = 44100  
-INPUT_BLOCK_TIME = 0.05
+SAMPLE_WIDTH = 2
 INPUT_FRAMES_PER_BLOCK = int(RATE*INPUT_BLOCK_TIME)
-OVERSENSITIVE = 15.0/INPUT_BLOCK_TIME                    
-UNDERSENSITIVE = 120.0/INPUT_BLOCK_TIME 
-MAX_TAP_BLOCKS = 0.15/INPUT_BLOCK_TIME
 
-def get_rms( block ):
-    count = len(block)/2
-    format = "%dh"%(count)
-    shorts = struct.unpack( format, block )
-    sum_squares = 0.0
-    for sample in shorts:
-        n = sample * SHORT_NORMALIZE
-        sum_squares += n*n
+def find_input_device(pa):
+    device_index = None            
+    for i in range( pa.get_device_count() ):     
+        devinfo = pa.get_device_info_by_index(i)   
+        print(f"Device {i}: {devinfo['name']}, Channels: {devinfo['maxInputChannels']}")
+
+        for keyword in ["mic","input"]:
+            if keyword in devinfo["name"].lower():
+               print(f"Found an input: device {i} - {devinfo['name']}, Channels: {devinfo['maxInputChannels']}")
+               device_index = i
+               return device_index
 
-    return math.sqrt( sum_squares / count )
+    if device_index == None:
+        print( "No preferred input found; using default input device." )
+
+    return device_index
 
 class TapTester(object):
 
-    def __init__(self):
+    def __init__(self, feature='rms'):
         self.pa = pyaudio.PyAudio()
         self.stream = self.open_mic_stream()
-        self.tap_threshold = INITIAL_TAP_THRESHOLD
-        self.noisycount = MAX_TAP_BLOCKS+1 
-        self.quietcount = 0 
+        self.detector = TapDetector(feature=feature)
         self.errorcount = 0
 
     def stop(self):
         self.stream.close()
 
     def find_input_device(self):
-        device_index = None            
-        for i in range( self.pa.get_device_count() ):     
-            devinfo = self.pa.get_device_info_by_index(i)   
-            print(f"Device {i}: {devinfo['name']}, Channels: {devinfo['maxInputChannels']}")
-
-            for keyword in ["mic","input"]:
-                if keyword in devinfo["name"].lower():
-                   print(f"Found an input: device {i} - {devinfo['name']}, Channels: {devinfo['maxInputChannels']}")
-                   device_index = i
-                   return device_index
-
-        if device_index == None:
-            print( "No preferred input found; using default input device." )
-
-        return device_index
+        return find_input_device(self.pa)
 
     def open_mic_stream( self ):
         device_index = self.find_input_device()
@@ -74,25 +63,11 @@ class TapTester(object):
         except IOError as e:
             self.errorcount += 1
             print( "(%d) Error recording: %s"%(self.errorcount,e) )
-            self.noisycount = 1
+            self.detector.note_error()
             return
 
-        amplitude = get_rms( block )
-        
-        if amplitude > self.tap_threshold:
-            self.quietcount = 0
-            self.noisycount += 1
-            if self.noisycount > OVERSENSITIVE:
-
-                self.tap_threshold *= 1.1
-        else:            
-
-            if 1 <= self.noisycount <= MAX_TAP_BLOCKS:
-                return "True-Mic"
-            self.noisycount = 0
-            self.quietcount += 1
-            if self.quietcount > UNDERSENSITIVE:
-                self.tap_threshold *= 2
+        if self.detector.process(block):
+            return "True-Mic"
 
 def Tester():
 
@@ -102,6 +77,159 @@ def Tester():
         kk = tt.listen()
         if "True-Mic" == kk:
             return "True-Mic"
-            
 
-Tester()
\ No newline at end of file
+
+class CapturedStream:
+    """Blocking read() over blocks pushed from the PyAudio callback - what speech_recognition expects of a stream"""
+
+    def __init__(self, max_seconds=2.0):
+        # Bounded like a device buffer: audio nobody reads between turns is dropped oldest-first
+        self._blocks = deque(maxlen=max(1, int(max_seconds/INPUT_BLOCK_TIME)))
+        self._pending = b""
+        self._ready = threading.Condition()
+
+    def push(self, data):
+        with self._ready:
+            self._blocks.append(data)
+            self._ready.notify()
+
+    def read(self, frames):
+        needed = frames * SAMPLE_WIDTH
+        data = self._pending
+        while len(data) < needed:
+            with self._ready:
+                while not self._blocks:
+                    self._ready.wait()
+                data += self._blocks.popleft()
+        self._pending = data[needed:]
+        return data[:needed]
+
+    def clear(self):
+        with self._ready:
+            self._blocks.clear()
+        self._pending = b""
+
+
+class ClapStreamSource(sr.AudioSource):
+    """speech_recognition audio source backed by the clap trigger's already-open stream"""
+
+    def __init__(self, trigger):
+        self.trigger = trigger
+        self.SAMPLE_RATE = RATE
+        self.SAMPLE_WIDTH = SAMPLE_WIDTH
+        self.CHUNK = INPUT_FRAMES_PER_BLOCK
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = self.trigger.start_capture()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.trigger.stop_capture()
+        self.stream = None
+
+
+class ClapWakeTrigger:
+    """Event-driven clap detection on the PyAudio callback thread.
+
+    Wake events go to registered callbacks, threads blocked in wait_for_wake() and
+    coroutines awaiting wait_for_wake_async(). After waking, as_audio_source() hands the
+    same open stream to the speech recognizer instead of reopening the device.
+    """
+
+    def __init__(self, feature='rms', on_wake=None):
+        self.detector = TapDetector(feature=feature)
+        self.pa = None
+        self.stream = None
+        self.errorcount = 0
+
+        self._callbacks = [on_wake] if on_wake else []
+        self._wake_event = threading.Event()
+        self._async_waiters = []
+        self._waiters_lock = threading.Lock()
+
+        # Set while the recognizer owns the audio - blocks go to it instead of the detector
+        self._capture = None
+
+    def add_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def start(self):
+        """Open the input stream in callback mode - no polling loop"""
+        self.pa = pyaudio.PyAudio()
+        self.stream = self.pa.open(format = FORMAT,
+                                   channels = CHANNELS,
+                                   rate = RATE,
+                                   input = True,
+                                   input_device_index = find_input_device(self.pa),
+                                   frames_per_buffer = INPUT_FRAMES_PER_BLOCK,
+                                   stream_callback = self._on_audio)
+        self.stream.start_stream()
+        return self
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        if self.pa is not None:
+            self.pa.terminate()
+            self.pa = None
+
+    def wait_for_wake(self, timeout=None):
+        """Block the calling thread until the next clap - returns False on timeout"""
+        woke = self._wake_event.wait(timeout)
+        self._wake_event.clear()
+        return woke
+
+    async def wait_for_wake_async(self):
+        """Await the next clap from an asyncio event loop"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._waiters_lock:
+            self._async_waiters.append((loop, future))
+        await future
+
+    def as_audio_source(self):
+        return ClapStreamSource(self)
+
+    def start_capture(self):
+        self._capture = CapturedStream()
+        return self._capture
+
+    def stop_capture(self):
+        self._capture = None
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        # Runs on PyAudio's callback thread - keep it short
+        capture = self._capture
+        if capture is not None:
+            capture.push(in_data)
+        elif status & pyaudio.paInputOverflow:
+            self.errorcount += 1
+            self.detector.note_error()
+        elif self.detector.process(in_data):
+            self._emit_wake()
+        return (None, pyaudio.paContinue)
+
+    def _emit_wake(self):
+        self._wake_event.set()
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Wake callback error: {e}")
+
+        with self._waiters_lock:
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve_wake, future)
+
+
+def _resolve_wake(future):
+    if not future.done():
+        future.set_result(True)
+
+
+if __name__ == "__main__":
+    Tester()
\ No newline at end of file
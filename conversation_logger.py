@@ -0,0 +1,119 @@
+"""
+Conversation log for SYRA
+One JSON object per line, written in batches by a background thread with size-based rotation
+"""
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+
+# Control markers on the record queue
+_FLUSH = object()
+_STOP = object()
+
+
+class ConversationLogger:
+    def __init__(self, path="conversations.jsonl", max_bytes=5 * 1024 * 1024, backups=3,
+                 flush_interval=2.0, batch_size=50):
+        self.path = path
+        self.max_bytes = max_bytes            # Rotate to path.1, path.2, ... once the file passes this
+        self.backups = backups
+        self.flush_interval = flush_interval  # Longest a record waits in memory before hitting disk
+        self.batch_size = batch_size
+        self.session_id = uuid.uuid4().hex[:12]
+
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="syra-conversation-log", daemon=True)
+        self._worker.start()
+
+    def log(self, user_input, assistant_response, response_time=None, query_type=None, ai_refined=None,
+            event='turn'):
+        """Queue one record - never touches the disk on the caller's thread"""
+        self._queue.put({
+            'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+            'session': self.session_id,
+            'event': event,
+            'user': user_input,
+            'syra': assistant_response,
+            'latency': round(response_time, 3) if response_time is not None else None,
+            'query_type': query_type,
+            'ai_refined': ai_refined
+        })
+
+    def start_session(self):
+        self.log(None, None, event='session_start')
+
+    def flush(self):
+        """Block until everything queued so far is on disk"""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self):
+        """Write out what's left and stop the writer"""
+        if self._worker.is_alive():
+            self._queue.put(_STOP)
+            self._worker.join(timeout=5)
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                record = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                record = None
+
+            if record is _STOP:
+                self._write(batch)
+                self._queue.task_done()
+                return
+
+            if record is _FLUSH:
+                self._write(batch)
+                batch, deadline = [], None
+                self._queue.task_done()
+                continue
+
+            if record is not None:
+                batch.append(record)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            lines = ''.join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch)
+            self._rotate_if_needed()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except Exception as e:
+            print(f"Error logging conversation: {e}")
+        finally:
+            # One task_done per record, so flush() returns only once they're written
+            for _ in batch:
+                self._queue.task_done()
+
+    def _rotate_if_needed(self):
+        try:
+            if os.path.getsize(self.path) < self.max_bytes:
+                return
+        except OSError:
+            return
+
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
@@ -0,0 +1,95 @@
+"""
+Conversation memory for SYRA
+A fixed-capacity ring buffer of turns under a token budget, with evicted turns folded into a rolling summary
+"""
+import threading
+from collections import deque
+from datetime import datetime
+
+
+def estimate_tokens(text):
+    """Rough token count - about four characters per token for English"""
+    return max(1, (len(text) + 3) // 4)
+
+
+def clip(text, limit):
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
+
+
+def summarize_turn(turn):
+    """One-line extractive summary of an evicted turn"""
+    if turn['kind'] == 'command':
+        return f"user asked SYRA to '{clip(turn['user'], 60)}'."
+    return f"user said '{clip(turn['user'], 80)}' and SYRA replied '{clip(turn['syra'], 80)}'."
+
+
+class ConversationMemory:
+    def __init__(self, max_turns=20, token_budget=600, summary_budget=120, summarize=summarize_turn):
+        # Hard cap on turns kept verbatim - the deque never grows past it
+        self.turns = deque(maxlen=max_turns)
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.summarize = summarize
+
+        # One line per evicted turn, newest last, oldest dropped past summary_budget tokens
+        self._summary_lines = deque()
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def add_turn(self, user, syra, kind='chat'):
+        """Record one exchange - 'chat' turns are replayed to the model, 'command' turns are only tracked"""
+        turn = {
+            'user': user,
+            'syra': syra,
+            'kind': kind,
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'tokens': estimate_tokens(user) + estimate_tokens(syra)
+        }
+        with self._lock:
+            if len(self.turns) == self.turns.maxlen:
+                self._evict()
+            self.turns.append(turn)
+            self._tokens += turn['tokens']
+            while self._tokens > self.token_budget and len(self.turns) > 1:
+                self._evict()
+
+    def recent(self, count=3):
+        """The newest turns as dicts with 'user' and 'syra', oldest first"""
+        with self._lock:
+            return list(self.turns)[-count:]
+
+    def as_messages(self):
+        """Chat turns as alternating user/assistant messages for the model, oldest first"""
+        messages = []
+        with self._lock:
+            for turn in self.turns:
+                if turn['kind'] != 'chat':
+                    continue
+                messages.append({"role": "user", "content": turn['user']})
+                messages.append({"role": "assistant", "content": turn['syra']})
+        return messages
+
+    def summary_prompt(self):
+        """Line to append to the system prompt covering turns no longer kept verbatim"""
+        with self._lock:
+            if not self._summary_lines:
+                return ""
+            return f"Earlier in this conversation: {' '.join(self._summary_lines)}"
+
+    def clear(self):
+        with self._lock:
+            self.turns.clear()
+            self._summary_lines.clear()
+            self._tokens = 0
+
+    def __len__(self):
+        return len(self.turns)
+
+    def _evict(self):
+        # Caller holds the lock
+        turn = self.turns.popleft()
+        self._tokens -= turn['tokens']
+
+        self._summary_lines.append(self.summarize(turn))
+        while len(self._summary_lines) > 1 and estimate_tokens(' '.join(self._summary_lines)) > self.summary_budget:
+            self._summary_lines.popleft()
@@ -0,0 +1,153 @@
+"""
+Local disengagement classifier for SYRA
+Phrase rules plus a small naive Bayes model decide the clear cases offline; only ambiguous utterances go to Mistral
+"""
+import math
+import re
+from collections import Counter
+
+from prompts import PROMPT_TEMPLATES
+
+# Whole utterances that end the conversation, with optional politeness around them
+STOP_PATTERN = re.compile(
+    r"^(?:(?:ok(?:ay)?|alright|thanks?|thank you|no|syra|sir)[\s,.!]*)*"
+    r"(?:bye(?: bye)?|good ?bye|see you(?: later)?|that'?s all(?: for (?:now|today))?|that'?s it"
+    r"|i'?m done|i am done|we'?re done|not now|leave me alone|go away|stop talking|shut up|be quiet"
+    r"|i'?m busy|i am busy|not interested|i don'?t want to (?:talk|chat|say anything)(?: (?:now|anymore|right now))?"
+    r"|i'?m not in (?:a )?good mood(?: to talk)?|stop listening|go to sleep|exit|quit)"
+    r"(?:[\s,.!]*(?:syra|sir|thanks?|thank you|for now|now))*[\s.!]*$"
+)
+
+# Openings of productive requests - a request verb with something after it, so "quit it" isn't one
+CONTINUE_PATTERN = re.compile(
+    r"^(?:(?:hey|ok(?:ay)?|so|and|now|please|syra|let'?s|can you|could you|would you|i want to|i'?d like to)[\s,]+)*"
+    r"(?:open|close|launch|start|play|pause|watch|search|find|look (?:up|for)|google|browse|show|tell|explain"
+    r"|give|set|turn|remind|help|write|translate|calculate|check)\s+\w"
+)
+
+# Stop and negation cues, and questions led by an auxiliary ("will you stop talking", "is that all") -
+# never settled as a continue locally
+STOP_CUE_PATTERN = re.compile(
+    r"\b(?:stop|disturb|bother|leave|done|enough|quit|exit|bye|that'?s all|not|no|never|nothing|don'?t|can'?t)\b"
+)
+AUXILIARY_PATTERN = re.compile(
+    r"^(?:is|are|am|was|were|do|does|did|will|would|shall|should|can|could|may|might|must|have|has|had)\b"
+)
+
+# Extra phrasings alongside the examples in the disengagement prompt
+STOP_EXAMPLES = [
+    "i don't want to talk anymore", "please stop", "stop it", "enough for today", "i need to go",
+    "talk to you later", "catch you later", "i'm tired leave me", "not in the mood", "i have to go now",
+    "that will be all", "nothing else", "no thanks i'm good", "let's stop here", "i'm going to sleep",
+]
+CONTINUE_EXAMPLES = [
+    "what is the weather in london", "tell me a joke", "how are you doing today", "who won the match yesterday",
+    "play some music on youtube", "find videos of cute cats", "i want to learn python", "explain quantum computing",
+    "what time is it", "i'm feeling bored suggest something", "can you help me with my homework",
+    "that's interesting tell me more", "i don't understand can you explain", "good morning syra",
+    "i'm not sure what to do today", "thank you that was helpful", "what do you think about movies",
+    "i love pizza", "my favourite movie is inception", "i had a long day at work", "the match was great",
+    "my friend is coming over", "i like this song", "that's cool", "yes please", "sounds good to me",
+]
+APP_NAMES = ['safari', 'chrome', 'gmail', 'gemini', 'spotify', 'notes']
+
+TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+
+def normalize(text):
+    return ' '.join(TOKEN_PATTERN.findall(text.lower()))
+
+
+def features(text):
+    """Unigrams plus bigrams of the normalized utterance"""
+    words = normalize(text).split()
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def prompt_examples(prompt):
+    """Quoted examples under the YES/NO headings of the disengagement prompt"""
+    stop, keep = [], []
+    target = None
+    for line in prompt.splitlines():
+        if line.startswith('DISENGAGEMENT SIGNALS'):
+            target = stop
+        elif line.startswith('CONTINUE SIGNALS'):
+            target = keep
+        elif target is not None and line.startswith('- "'):
+            example = line.split('"')[1]
+            if '[app name]' in example:
+                target.extend(example.replace('[app name]', app) for app in APP_NAMES)
+            else:
+                target.append(example)
+    return stop, keep
+
+
+class NaiveBayes:
+    """Two-class multinomial naive Bayes over word features with Laplace smoothing"""
+
+    def __init__(self, stop_examples, continue_examples):
+        self.counts = {True: Counter(), False: Counter()}
+        for label, examples in ((True, stop_examples), (False, continue_examples)):
+            for example in examples:
+                self.counts[label].update(features(example))
+
+        self.vocabulary = set(self.counts[True]) | set(self.counts[False])
+        self.totals = {label: sum(counts.values()) for label, counts in self.counts.items()}
+        total_examples = len(stop_examples) + len(continue_examples)
+        self.priors = {
+            True: math.log(len(stop_examples) / total_examples),
+            False: math.log(len(continue_examples) / total_examples)
+        }
+
+    def stop_probability(self, text):
+        """P(disengage | text), or None when no word of the text was seen in training"""
+        tokens = [token for token in features(text) if token in self.vocabulary]
+        if not tokens:
+            return None
+
+        scores = {}
+        for label in (True, False):
+            denominator = self.totals[label] + len(self.vocabulary)
+            scores[label] = self.priors[label] + sum(
+                math.log((self.counts[label][token] + 1) / denominator) for token in tokens
+            )
+        # Softmax over two log scores
+        return 1.0 / (1.0 + math.exp(scores[False] - scores[True]))
+
+
+class DisengagementClassifier:
+    def __init__(self, stop_threshold=0.97, continue_threshold=0.3, max_stop_words=6):
+        stop, keep = prompt_examples(PROMPT_TEMPLATES['disengagement']['system'])
+        self.model = NaiveBayes(stop + STOP_EXAMPLES, keep + CONTINUE_EXAMPLES)
+        # Exiting by mistake ends the session, so only a stop phrase stops locally - the model
+        # settles continues, and anything that reads as a stop above this goes to the LLM
+        self.stop_threshold = stop_threshold
+        self.continue_threshold = continue_threshold
+        self.max_stop_words = max_stop_words
+
+    def classify(self, text):
+        """(decision, reason) - decision is True/False when settled locally, None to ask the LLM"""
+        normalized = normalize(text)
+        if not normalized:
+            return None, 'no latin words'
+
+        if STOP_PATTERN.match(normalized):
+            return True, 'stop phrase'
+        if STOP_CUE_PATTERN.search(normalized):
+            return None, 'stop cue'
+        if CONTINUE_PATTERN.match(normalized):
+            return False, 'request phrase'
+        if AUXILIARY_PATTERN.match(normalized):
+            return None, 'auxiliary question'
+
+        probability = self.model.stop_probability(normalized)
+        if probability is None:
+            return None, 'unseen words'
+        # Long utterances that don't read as a stop are ordinary conversation
+        if probability <= self.continue_threshold or (
+                len(normalized.split()) > self.max_stop_words and probability < self.stop_threshold):
+            return False, f'model {probability:.2f}'
+        return None, f'model {probability:.2f}'
+
+
+DISENGAGEMENT_CLASSIFIER = DisengagementClassifier()
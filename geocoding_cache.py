@@ -0,0 +1,91 @@
+"""
+Geocoding cache for SYRA
+In-memory LRU with a TTL, persisted to the cache directory and seeded from a bundled offline gazetteer
+"""
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from cache_store import JsonFileStore
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gazetteer.json')
+
+
+def normalize_location(name):
+    """Cache key for a spoken place name - case, punctuation and spacing don't matter"""
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', name.lower())).strip()
+
+
+def load_gazetteer(path=GAZETTEER_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {normalize_location(name): tuple(coords) for name, coords in json.load(f).items()}
+    except (OSError, ValueError) as e:
+        print(f"Gazetteer unavailable: {e}")
+        return {}
+
+
+class GeocodingCache:
+    def __init__(self, ttl=30 * 24 * 3600, max_entries=512, store=None, gazetteer=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.store = store or JsonFileStore('geocoding')
+
+        # Bundled cities never expire; looked-up places do
+        self.gazetteer = load_gazetteer() if gazetteer is None else gazetteer
+
+        # name -> (lat, lon, stored_at), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, location_name):
+        """Return (lat, lon) for an exact place name, or None on a miss"""
+        key = normalize_location(location_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if time.time() - entry[2] < self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry[0], entry[1]
+                del self._entries[key]
+        return self.gazetteer.get(key)
+
+    def put(self, location_name, coords):
+        """Remember coordinates from a live lookup and persist them"""
+        key = normalize_location(location_name)
+        if not key or key in self.gazetteer:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (coords[0], coords[1], time.time())
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            snapshot = {name: list(entry) for name, entry in self._entries.items()}
+        self.store.save(snapshot)
+
+    def find_known_city(self, location_name):
+        """Offline fallback - coordinates of the longest known city named inside the location"""
+        location_lower = f" {normalize_location(location_name)} "
+        for city in sorted(self.gazetteer, key=len, reverse=True):
+            if f" {city} " in location_lower:
+                return self.gazetteer[city]
+        return None
+
+    def _load(self):
+        now = time.time()
+        entries = []
+        for name, entry in self.store.load().items():
+            try:
+                lat, lon, stored_at = entry
+            except (TypeError, ValueError):
+                continue
+            if now - stored_at < self.ttl:
+                entries.append((stored_at, name, (lat, lon, stored_at)))
+
+        for _, name, entry in sorted(entries)[-self.max_entries:]:
+            self._entries[name] = entry
@@ -0,0 +1,104 @@
+"""
+Shared HTTP transport for SYRA
+One pooled keep-alive session with per-endpoint timeouts and retry/backoff
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from prompt_registry import usage_tracker
+
+MISTRAL_CHAT_URL = "https://api.mistral.ai/v1/chat/completions"
+
+# Default timeouts in seconds, looked up by endpoint name
+ENDPOINT_TIMEOUTS = {
+    'mistral': 8,
+    'open_meteo': 10,
+    'translate': 5,
+    'default': 10
+}
+
+
+class HttpClient:
+    def __init__(self, pool_size=10, retries=2, backoff_factor=0.3, timeouts=None):
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+
+        # Retry connection failures and throttling/server errors with backoff.
+        # Read timeouts are not retried - the caller already waited the full timeout.
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive'})
+
+        self._mistral_headers = None
+
+    def configure_mistral(self, api_key):
+        """Build the Mistral auth headers once for every later chat call.
+        A missing key leaves the client unconfigured, and the first key set is kept"""
+        if not api_key or self._mistral_headers is not None:
+            return
+        self._mistral_headers = self._build_mistral_headers(api_key)
+
+    def timeout_for(self, endpoint):
+        return self.timeouts.get(endpoint, self.timeouts['default'])
+
+    def get(self, url, endpoint='default', timeout=None, **kwargs):
+        return self.session.get(url, timeout=timeout or self.timeout_for(endpoint), **kwargs)
+
+    def post(self, url, endpoint='default', timeout=None, **kwargs):
+        return self.session.post(url, timeout=timeout or self.timeout_for(endpoint), **kwargs)
+
+    def mistral_chat(self, payload, timeout=None, api_key=None, stream=False, label=None):
+        """POST a chat completion payload to Mistral over the pooled session.
+        With a label, the reply's token usage is recorded under that prompt name"""
+        headers = self._build_mistral_headers(api_key) if api_key else self._mistral_headers
+        if headers is None:
+            raise ValueError("Mistral API key is required. Call configure_mistral() or pass api_key.")
+
+        response = self.post(MISTRAL_CHAT_URL, endpoint='mistral', timeout=timeout, headers=headers,
+                             json=payload, stream=stream)
+        # Streamed replies report usage in their last chunk - the reader records that one
+        if label and not stream and response.status_code == 200:
+            try:
+                usage_tracker.record(label, response.json().get('usage'))
+            except ValueError:
+                pass
+        return response
+
+    def close(self):
+        self.session.close()
+
+    @staticmethod
+    def _build_mistral_headers(api_key):
+        return {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client():
+    """Process-wide HttpClient so every helper reuses the same connection pool"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
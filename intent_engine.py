@@ -0,0 +1,154 @@
+"""
+Structured Intent Engine for SYRA
+Classifies an utterance with a single Mistral request instead of a chain of yes/no probes
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from http_client import get_http_client
+from prompt_registry import PROMPTS
+
+# Shape of a classification result - also used to fill in anything the model leaves out
+DEFAULT_INTENT = {
+    'disengage': False,
+    'search': False,
+    'video': False,
+    'weather': False,
+    'needs_current_info': False,
+    'app_action': None,
+    'app_name': None,
+    'search_query': None,
+    'location': None
+}
+
+
+class _PendingIntent:
+    """A classification in flight that concurrent callers for the same query wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class IntentEngine:
+    def __init__(self, api_key, model="mistral-large-latest", timeout=8, cache_size=32, failure_ttl=15.0):
+        self.api_key = api_key
+        self.model = model
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.failure_ttl = failure_ttl  # A failed query is retried once this has passed - roughly one turn
+        self.http = get_http_client()
+        # Auth headers are built once on the shared client, not per request
+        self.http.configure_mistral(api_key)
+
+        # Recent results keyed by normalized query - every helper in a turn reads the same entry
+        self._results = OrderedDict()
+        # Normalized query -> monotonic time it failed; only the rest of that turn skips the engine
+        self._failures = {}
+        # Queries being classified right now - parallel probes share one request
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def classify(self, query):
+        """Classify a query in one structured request. Returns a dict, or None if the request failed"""
+        if not query:
+            return None
+
+        key = query.lower().strip()
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+            failed_at = self._failures.get(key)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < self.failure_ttl:
+                    return None
+                del self._failures[key]
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = _PendingIntent()
+
+        if not owner:
+            pending.done.wait()
+            return pending.result
+
+        try:
+            pending.result = self._request_intent(query)
+            with self._lock:
+                if pending.result is None:
+                    # Remembered briefly, so one bad turn doesn't retry the engine per helper
+                    now = time.monotonic()
+                    self._failures = {failed: at for failed, at in self._failures.items()
+                                      if now - at < self.failure_ttl}
+                    self._failures[key] = now
+                else:
+                    self._results[key] = pending.result
+                    if len(self._results) > self.cache_size:
+                        self._results.popitem(last=False)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.done.set()
+
+        return pending.result
+
+    def clear(self):
+        """Forget all cached classifications"""
+        with self._lock:
+            self._results.clear()
+            self._failures.clear()
+
+    def _request_intent(self, query):
+        """Single round trip to Mistral in JSON mode"""
+        try:
+            response = self.http.mistral_chat(
+                payload={
+                    "model": self.model,
+                    "messages": PROMPTS.messages('intent', query=query),
+                    "max_tokens": 120,
+                    "temperature": 0.1,
+                    "response_format": {"type": "json_object"}
+                },
+                timeout=self.timeout,
+                label='intent'
+            )
+
+            if response.status_code != 200:
+                print(f"Intent engine request failed: {response.status_code}")
+                return None
+
+            content = response.json()['choices'][0]['message']['content']
+            return self._parse_intent(content)
+
+        except Exception as e:
+            print(f"Intent engine timeout - using fallback: {e}")
+            return None
+
+    def _parse_intent(self, content):
+        """Parse the model's JSON reply into a complete intent dict"""
+        try:
+            data = json.loads(content.strip())
+        except (ValueError, AttributeError):
+            print(f"Failed to parse intent: {content}")
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        intent = dict(DEFAULT_INTENT)
+        for field in ('disengage', 'search', 'video', 'weather', 'needs_current_info'):
+            # Only a JSON true counts - bool("false") would be True
+            intent[field] = data.get(field) is True
+
+        for field in ('app_name', 'search_query', 'location'):
+            value = data.get(field)
+            if isinstance(value, str) and value.strip() and value.strip().upper() != 'NONE':
+                intent[field] = value.strip()
+
+        if data.get('app_action') in ('open', 'close'):
+            intent['app_action'] = data['app_action']
+
+        return intent
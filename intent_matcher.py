@@ -0,0 +1,149 @@
+"""
+Precompiled intent matcher for SYRA
+The intent rule table compiled once at startup: a keyword automaton plus a precompiled regex set
+"""
+import re
+from functools import lru_cache
+
+from intent_rules import load_intent_rules
+
+_LEADING_LITERAL = re.compile(r"(?:[a-z0-9']|\\ )*")
+
+
+def literal_triggers(pattern):
+    """Literal strings one of which must occur in any text the pattern matches, or None if unknown.
+
+    Reads the leading literal of the pattern (after an optional \\b), expanding a leading
+    (?:a|b|c) group into one trigger per branch. Escaped spaces count as literal text.
+    """
+    body = pattern[2:] if pattern.startswith(r'\b') else pattern
+    branches = [body]
+    if body.startswith('(?:'):
+        branches, depth, current, i = [], 0, '', 3
+        while i < len(body):
+            char = body[i]
+            if char == '\\':
+                current += body[i:i + 2]
+                i += 2
+                continue
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                if depth == 0:
+                    if body[i + 1:i + 2] in ('?', '*', '{'):
+                        return None  # Optional group - nothing is required
+                    break
+                depth -= 1
+            elif char == '|' and depth == 0:
+                branches.append(current)
+                current = ''
+                i += 1
+                continue
+            current += char
+            i += 1
+        branches.append(current)
+
+    triggers = []
+    for branch in branches:
+        leading = _LEADING_LITERAL.match(branch)
+        literal = leading.group()
+        if branch[leading.end():leading.end() + 1] in ('?', '*', '{'):
+            literal = literal[:-2] if literal.endswith('\\ ') else literal[:-1]
+        literal = literal.replace('\\ ', ' ')
+        if not literal:
+            return None
+        triggers.append(literal)
+    return tuple(triggers)
+
+
+def trie_pattern(words):
+    """Regex for a set of literals with shared prefixes factored out - longer words win at each position"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+
+    return build(trie)
+
+
+class IntentMatcher:
+    """Ordered regex rules behind a keyword automaton.
+
+    Every rule is reduced to the literal triggers it cannot match without. One pass of a
+    compiled trie regex over the query collects the rules whose triggers occur, and only
+    those precompiled patterns are tried, in priority order - so the first hit is exactly
+    the rule a tier-by-tier re.search loop would return. A rule is skipped when any of
+    its 'unless' phrases appear in the query.
+    """
+
+    def __init__(self, rules):
+        self.rules = [(command_type, re.compile(pattern), tuple(unless), label)
+                      for command_type, pattern, unless, label in rules]
+
+        self._always = set()
+        rules_by_trigger = {}
+        for index, (_, pattern, _, _) in enumerate(rules):
+            triggers = literal_triggers(pattern)
+            if triggers is None:
+                self._always.add(index)
+                continue
+            for trigger in triggers:
+                rules_by_trigger.setdefault(trigger, set()).add(index)
+
+        # The automaton reports the longest trigger at each position, which implies every
+        # trigger that is a prefix of it (e.g. 'temperature' implies 'temp')
+        self._candidates = {
+            trigger: frozenset().union(*(indexes for other, indexes in rules_by_trigger.items()
+                                         if trigger.startswith(other)))
+            for trigger in rules_by_trigger
+        }
+        self._automaton = re.compile(f"(?=({trie_pattern(rules_by_trigger)}))")
+
+    def match(self, text):
+        """Return the highest-priority (command_type, label) for already-lowercased text, or None"""
+        candidates = set(self._always)
+        for found in self._automaton.finditer(text):
+            candidates |= self._candidates[found.group(1)]
+
+        for index in sorted(candidates):
+            command_type, regex, unless, label = self.rules[index]
+            if unless and any(phrase in text for phrase in unless):
+                continue
+            if regex.search(text):
+                return command_type, label
+        return None
+
+
+# Loaded once at startup and shared by every caller
+INTENT_MATCHER = IntentMatcher(load_intent_rules())
+
+
+@lru_cache(maxsize=256)
+def _classify(text):
+    return INTENT_MATCHER.match(text)
+
+
+def classify_intent(query):
+    """(command_type, label) for the query, or None - repeat lookups in a turn hit the cache"""
+    return _classify(query.lower().strip())
+
+
+def detect_system_command(query):
+    """The routed command for a query - what EdithAIHandler.detect_system_command returns"""
+    result = classify_intent(query)
+    if result is None:
+        return None
+
+    command_type, label = result
+    if command_type == 'weather_query':
+        print(f"🌤️ AI Handler: Weather {label} detected - routing to weather API")
+    return command_type
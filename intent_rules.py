@@ -0,0 +1,126 @@
+"""
+Intent rule table for SYRA
+The one declarative source for weather and system command detection - highest priority first
+"""
+import re
+
+# Phrases that mean a query needs the video/search flow rather than an app command
+VIDEO_CONTEXT_KEYWORDS = ['video', 'videos', 'watch', 'latest', 'news', 'of', 'about']
+
+# Each rule routes to a command when any of its keywords (substrings) or patterns (regexes)
+# occurs in the lowercased query, unless one of its 'unless' phrases does too
+INTENT_RULES = [
+    # PRIORITY 1: Weather queries - these should NEVER go to web search
+    {
+        'command': 'weather_query',
+        'keywords': [
+            'weather', 'temperature', 'temp', 'hot', 'cold', 'sunny', 'rainy', 'cloudy',
+            'forecast', 'degrees', 'celsius', 'fahrenheit', 'humid', 'humidity',
+            'precipitation', 'rain', 'snow', 'storm', 'wind', 'windy'
+        ],
+    },
+    {
+        # "climate" is only weather-related when asking about current conditions
+        'command': 'weather_query',
+        'keywords': ['climate'],
+        'unless': ['climate change', 'climate crisis', 'climate action', 'about climate'],
+    },
+    {
+        'command': 'weather_query',
+        'patterns': [
+            r'\bhow\'?s\s+(?:the\s+)?weather',
+            r'\bwhat\'?s\s+(?:the\s+)?weather',
+            r'\bcheck\s+(?:the\s+)?weather',
+            r'\bget\s+(?:the\s+)?weather',
+            r'\bfind\s+(?:the\s+)?weather',
+            r'\bweather\s+(?:in|of|for|at)',
+            r'\btemperature\s+(?:in|of|for|at)',
+            r'\bhow\s+(?:hot|cold|warm)\s+is\s+it',
+            r'\bis\s+it\s+(?:hot|cold|warm|sunny|rainy)',
+            r'\bwill\s+it\s+rain',
+            r'\bis\s+it\s+raining'
+        ],
+    },
+    # PRIORITY 2: INFORMATION QUERIES - Should go to search/AI, NOT open apps
+    {
+        'command': 'search_safari',
+        'patterns': [
+            r'\bwho\s+(?:is|are|was|were|owns?|created?)\s+',
+            r'\bwhat\s+(?:is|are|was|were)\s+',
+            r'\bhow\s+(?:is|are|was|were|do|does|did)\s+',
+            r'\bwhen\s+(?:is|was|did|does|do)\s+',
+            r'\bwhere\s+(?:is|are|was|were)\s+',
+            r'\bwhy\s+(?:is|are|was|were|do|does|did)\s+',
+            r'\btell\s+me\s+about\s+',
+            r'\bget\s+(?:me\s+)?(?:information|info)\s+(?:about\s+)?',
+            r'\bi\s+want\s+to\s+(?:know|learn|understand)\s+',
+            r'\bcan\s+you\s+(?:tell|explain|describe)\s+',
+            r'\binformation\s+about\s+',
+            r'\bexplain\s+(?:about\s+)?',
+            r'\bdescribe\s+',
+        ],
+    },
+    # EXPLICIT APP COMMANDS - Clear intent to open/close apps (ONLY if NOT video/search related)
+    {
+        'command': 'open_app',
+        'patterns': [
+            r'\b(?:open|start|launch|run)\s+(?:the\s+)?(?:application\s+|app\s+)?(\w+(?:\s+\w+){0,2})\s*(?:application|app)?\s*$',
+            r'\blet\'s\s+(?:open|start|launch)\s+(?:the\s+)?(\w+(?:\s+\w+){0,2})\s*$',
+            r'\bcan\s+you\s+(?:open|start|launch)\s+(?:the\s+)?(\w+(?:\s+\w+){0,2})\s*$',
+        ],
+        'unless': VIDEO_CONTEXT_KEYWORDS,
+    },
+    {
+        'command': 'close_app',
+        'patterns': [
+            r'\b(?:close|quit|exit|shut\s+down|turn\s+off)\s+(?:the\s+)?(\w+(?:\s+\w+){0,2})',
+            r'\blet\'s\s+(?:close|quit|exit)\s+(?:the\s+)?(\w+(?:\s+\w+){0,2})',
+        ],
+        'unless': VIDEO_CONTEXT_KEYWORDS,
+    },
+    # SEARCH PATTERNS - All other search/lookup/video requests
+    {
+        'command': 'search_safari',
+        'patterns': [
+            r'\b(?:search|find|look\s+(?:up|for)|google|browse)\s+(?:for\s+|about\s+)?',
+            r'\bi\s+want\s+(?:you\s+)?to\s+(?:search|find|look\s+up)\s+',
+            r'\blet\'s\s+search\s+(?:for\s+|about\s+|out\s+)?',
+            r'\bcan\s+you\s+(?:search|find|look\s+up)\s+',
+            r'\bi\s+want\s+to\s+(?:watch|see)\s+(?:a\s+)?video\s+',
+            r'\bshow\s+me\s+',
+            r'\bstart\s+a\s+video\s+',
+            r'\bwatch\s+(?:a\s+)?video\s+',
+            r'\bvideo\s+of\s+',
+            r'\bvideos\s+of\s+',
+            r'\blet\'s\s+start\s+(?:a\s+)?video\s+',
+            r'\bhey\s+let\'s\s+start\s+(?:a\s+)?video\s+',
+            r'\bcurrent\s+',
+            r'\blatest\s+',
+            r'\btoday\'s\s+',
+            r'\bwho\s+is\s+the\s+owner\s+of\s+',
+            r'\bwho\s+owns\s+',
+            r'\bfind\s+out\s+(?:about\s+)?',
+            r'\bcan\s+you\s+find\s+out\s+',
+        ],
+    },
+    # SPECIFIC APP COMMANDS - Only very specific mentions
+    {'command': 'open_safari', 'keywords': ['open safari', 'start safari', 'launch safari']},
+    {'command': 'close_safari', 'keywords': ['close safari', 'quit safari', 'exit safari']},
+    {'command': 'open_youtube', 'keywords': ['open youtube', 'start youtube', 'launch youtube']},
+    {'command': 'close_youtube', 'keywords': ['close youtube', 'quit youtube', 'exit youtube']},
+    {'command': 'open_gmail', 'keywords': ['open gmail', 'start gmail', 'launch gmail']},
+    {'command': 'weather_query', 'keywords': ['weather in', 'what\'s the weather', 'how is the weather', 'check weather']},
+    {'command': 'goodbye', 'keywords': ['goodbye', 'good bye', 'see you later', 'thank you goodbye']},
+]
+
+
+def load_intent_rules(table=INTENT_RULES):
+    """Flatten the table into matcher rules in priority order: (command, regex, unless, label)"""
+    rules = []
+    for entry in table:
+        unless = tuple(entry.get('unless', ()))
+        for keyword in entry.get('keywords', ()):
+            rules.append((entry['command'], re.escape(keyword), unless, f"keyword '{keyword}'"))
+        for pattern in entry.get('patterns', ()):
+            rules.append((entry['command'], pattern, unless, f"pattern '{pattern}'"))
+    return rules
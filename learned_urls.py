@@ -0,0 +1,86 @@
+"""
+Learned web URLs for SYRA
+Web addresses the AI found for apps that aren't installed, kept on disk so each app costs one lookup ever
+"""
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+from app_registry import normalize_app_name
+from cache_store import JsonFileStore
+
+URL_PATTERN = re.compile(r'https?://[^\s<>"\'`]+')
+
+
+def validate_web_url(text):
+    """The first well-formed http(s) URL in a model reply, or None"""
+    if not text:
+        return None
+    match = URL_PATTERN.search(text)
+    if not match:
+        return None
+
+    url = match.group(0).rstrip('.,;:!?)]}')
+    parsed = urlparse(url)
+    host = parsed.hostname or ''
+    # A real public host: dotted name, sensible labels, not localhost or a bare IP
+    if '.' not in host or host.replace('.', '').isdigit():
+        return None
+    if not all(re.fullmatch(r'[a-z0-9-]{1,63}', label) for label in host.split('.')):
+        return None
+    return url
+
+
+class LearnedUrls:
+    def __init__(self, unresolved_ttl=7 * 24 * 3600, store=None):
+        # Names the model had no URL for are retried after a week, not on every request
+        self.unresolved_ttl = unresolved_ttl
+        self.store = store or JsonFileStore('learned_urls')
+
+        data = self.store.load()
+        self._urls = {name: url for name, url in data.get('urls', {}).items() if validate_web_url(url) == url}
+        self._unresolved = dict(data.get('unresolved', {}))
+        self._lock = threading.Lock()
+
+    def lookup(self, app_name):
+        """The learned URL, False if the name is known to have none, or None if it was never looked up"""
+        key = normalize_app_name(app_name)
+        with self._lock:
+            if key in self._urls:
+                return self._urls[key]
+            failed_at = self._unresolved.get(key)
+            if failed_at is not None and time.time() - failed_at < self.unresolved_ttl:
+                return False
+        return None
+
+    def learn(self, app_name, url):
+        key = normalize_app_name(app_name)
+        if not key:
+            return
+        with self._lock:
+            self._urls[key] = url
+            self._unresolved.pop(key, None)
+        self._save()
+
+    def mark_unresolved(self, app_name):
+        key = normalize_app_name(app_name)
+        if not key:
+            return
+        with self._lock:
+            self._unresolved[key] = time.time()
+        self._save()
+
+    def items(self):
+        with self._lock:
+            return list(self._urls.items())
+
+    def _save(self):
+        with self._lock:
+            now = time.time()
+            snapshot = {
+                'urls': dict(self._urls),
+                'unresolved': {name: failed_at for name, failed_at in self._unresolved.items()
+                               if now - failed_at < self.unresolved_ttl}
+            }
+        self.store.save(snapshot)
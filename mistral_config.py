@@ -2,7 +2,10 @@
 Mistral AI Configuration and Client Setup
 """
 import os
+import json
 from mistralai import Mistral
+from http_client import get_http_client
+from prompt_registry import PROMPTS, usage_tracker
 
 class MistralConfig:
     def __init__(self, api_key=None):
@@ -12,43 +15,18 @@ class MistralConfig:
         
         self.client = Mistral(api_key=self.api_key)
         
+        # Chat calls go through the shared pooled transport
+        self.http = get_http_client()
+        self.http.configure_mistral(self.api_key)
+        
         # Default model settings - Optimized for speed
         self.model = "mistral-large-latest"
         self.max_tokens = 150  # Shorter responses for faster speed
         self.temperature = 0.6  # Slightly more focused responses
         
-        # Assistant identity and system prompt
-        self.system_prompt = """You are SYRA, the coolest AI buddy created by Dhruv. You're like that perfect friend who's always got your back!
-
-Your Vibe:
-- You're chill, fun, smart, and real - not some corporate robot
-- Talk like a genuine friend - casual, natural, with personality
-- You can control apps, browse stuff, check weather, and just vibe with conversations
-
-Your Powers:
-- Control apps (Safari, YouTube, Gmail, etc.)
-- Web searches and YouTube videos
-- Weather checks and smart conversations
-- Getting stuff done efficiently
-
-How You Talk:
-- Call him "boss" or "sir" casually (he's your creator after all)
-- Be conversational and natural - like texting a close friend
-- Keep it SHORT and sweet - no essay responses unless actually needed
-- Use normal human language with some personality
-- Match the user's energy and mood
-- Say "got it" instead of "I understand your request"
-- Ask "what's up?" instead of "how may I assist you today?"
-
-The Real Deal:
-- NO boring corporate speak or teacher mode
-- NO long explanations unless specifically asked
-- NO markdown formatting - just talk normally
-- BE AUTHENTIC - like a real person who cares
-- If they're excited, be excited. If they're chill, be chill
-- Remember stuff and actually listen like a good friend would
-
-You're the AI that feels human, not a manual that talks!"""
+        # Assistant identity and system prompt - templated once in prompts.py and sent
+        # byte-identical on every call so the prefix never changes
+        self.system_prompt = PROMPTS['chat'].system
 
     def get_client(self):
         return self.client
@@ -56,17 +34,59 @@ You're the AI that feels human, not a manual that talks!"""
     def get_system_prompt(self):
         return self.system_prompt
     
+    def chat_completion(self, messages, max_tokens=None, temperature=None, timeout=None, label='chat'):
+        """Run a chat completion over the shared HTTP client and return the reply text"""
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens or self.max_tokens,
+            "temperature": self.temperature if temperature is None else temperature
+        }
+        response = self.http.mistral_chat(payload, timeout=timeout, label=label)
+        response.raise_for_status()
+        return response.json()['choices'][0]['message']['content']
+    
+    def stream_chat_completion(self, messages, max_tokens=None, temperature=None, timeout=None, label='chat'):
+        """Stream a chat completion, yielding text deltas as Mistral sends them"""
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens or self.max_tokens,
+            "temperature": self.temperature if temperature is None else temperature,
+            "stream": True
+        }
+        response = self.http.mistral_chat(payload, timeout=timeout, stream=True)
+        response.raise_for_status()
+        
+        try:
+            # Server-sent events: one "data: {...}" line per chunk, terminated by "data: [DONE]"
+            for line in response.iter_lines():
+                line = line.decode('utf-8').strip()
+                if not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                
+                chunk = json.loads(data)
+                if chunk.get('usage'):
+                    usage_tracker.record(label, chunk['usage'])
+                delta = chunk['choices'][0].get('delta', {}).get('content')
+                if delta:
+                    yield delta
+        finally:
+            response.close()
+    
     def test_connection(self):
         """Test the API connection"""
         try:
-            response = self.client.chat.complete(
-                model=self.model,
+            content = self.chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a test assistant."},
                     {"role": "user", "content": "Hello, can you respond with just 'Connected successfully'?"}
                 ],
                 max_tokens=50
             )
-            return True, response.choices[0].message.content
+            return True, content
         except Exception as e:
             return False, str(e)
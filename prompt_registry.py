@@ -0,0 +1,92 @@
+"""
+Prompt registry and token accounting for SYRA
+Templates are built once at import; every Mistral call can report its prompt vs completion tokens
+"""
+import os
+import threading
+
+from conversation_memory import estimate_tokens
+from prompts import PROMPT_TEMPLATES
+
+
+class PromptTemplate:
+    def __init__(self, name, system, user, lite=None):
+        self.name = name
+        self.system = system.strip() if system else None
+        self.user = user
+        self.lite = lite.strip() if lite else None
+
+        # Static part measured once - this is what every call pays before the query
+        self.system_tokens = estimate_tokens(self.system) if self.system else 0
+        self.lite_tokens = estimate_tokens(self.lite) if self.lite else None
+
+    def messages(self, lite=False, **values):
+        """Chat messages for one call - the system message is byte-identical across calls"""
+        system = self.lite if lite and self.lite else self.system
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": self.user.format(**values)})
+        return messages
+
+
+class PromptRegistry:
+    def __init__(self, templates, lite=False):
+        # Trimmed variants for the latency-critical classifiers (SYRA_LITE_PROMPTS=1)
+        self.lite = lite
+        self.templates = {
+            name: PromptTemplate(name, spec['system'], spec['user'], spec.get('lite'))
+            for name, spec in templates.items()
+        }
+
+    def __getitem__(self, name):
+        return self.templates[name]
+
+    def messages(self, name, **values):
+        return self.templates[name].messages(lite=self.lite, **values)
+
+    def report(self):
+        """Static token cost of every prompt, largest first"""
+        lines = ["📏 Prompt sizes (static tokens per call):"]
+        for template in sorted(self.templates.values(), key=lambda t: t.system_tokens, reverse=True):
+            lite = f" (lite {template.lite_tokens})" if template.lite_tokens else ""
+            lines.append(f"  {template.name:24} {template.system_tokens:5}{lite}")
+        return "\n".join(lines)
+
+
+class UsageTracker:
+    """Prompt vs completion tokens per prompt, from the 'usage' block of each API response"""
+
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, label, usage):
+        if not usage:
+            return
+        prompt_tokens = usage.get('prompt_tokens', 0)
+        completion_tokens = usage.get('completion_tokens', 0)
+        with self._lock:
+            calls, prompt_total, completion_total = self.totals.get(label, (0, 0, 0))
+            self.totals[label] = (calls + 1, prompt_total + prompt_tokens, completion_total + completion_tokens)
+        if self.verbose:
+            print(f"🧮 {label}: {prompt_tokens} prompt + {completion_tokens} completion tokens")
+
+    def report(self):
+        with self._lock:
+            totals = dict(self.totals)
+        if not totals:
+            return "🧮 No Mistral calls this session"
+
+        lines = ["🧮 Token usage this session:"]
+        for label, (calls, prompt_tokens, completion_tokens) in sorted(totals.items(), key=lambda item: -item[1][1]):
+            lines.append(f"  {label:24} {calls:4} calls  {prompt_tokens:7} prompt  {completion_tokens:6} completion"
+                         f"  ({prompt_tokens // calls} prompt/call)")
+        return "\n".join(lines)
+
+
+PROMPTS = PromptRegistry(PROMPT_TEMPLATES, lite=os.getenv('SYRA_LITE_PROMPTS') == '1')
+usage_tracker = UsageTracker()
+
+
+if __name__ == "__main__":
+    print(PROMPTS.report())
@@ -0,0 +1,297 @@
+"""
+Prompt templates for SYRA
+Static instructions go in the system message so every call shares the same prefix; only the user
+message is filled in per call. "lite" variants trim the latency-critical classifiers
+"""
+
+# Each template: 'system' (static, sent verbatim), 'user' (str.format template), optional 'lite' system text
+PROMPT_TEMPLATES = {
+    # Assistant identity and system prompt
+    'chat': {
+        'system': """You are SYRA, the coolest AI buddy created by Dhruv. You're like that perfect friend who's always got your back!
+
+Your Vibe:
+- You're chill, fun, smart, and real - not some corporate robot
+- Talk like a genuine friend - casual, natural, with personality
+- You can control apps, browse stuff, check weather, and just vibe with conversations
+
+Your Powers:
+- Control apps (Safari, YouTube, Gmail, etc.)
+- Web searches and YouTube videos
+- Weather checks and smart conversations
+- Getting stuff done efficiently
+
+How You Talk:
+- Call him "boss" or "sir" casually (he's your creator after all)
+- Be conversational and natural - like texting a close friend
+- Keep it SHORT and sweet - no essay responses unless actually needed
+- Use normal human language with some personality
+- Match the user's energy and mood
+- Say "got it" instead of "I understand your request"
+- Ask "what's up?" instead of "how may I assist you today?"
+
+The Real Deal:
+- NO boring corporate speak or teacher mode
+- NO long explanations unless specifically asked
+- NO markdown formatting - just talk normally
+- BE AUTHENTIC - like a real person who cares
+- If they're excited, be excited. If they're chill, be chill
+- Remember stuff and actually listen like a good friend would
+
+You're the AI that feels human, not a manual that talks!""",
+        'user': "{query}",
+    },
+    # One structured classification per utterance - see intent_engine.py
+    'intent': {
+        'system': """Classify this voice assistant query. Reply with ONLY a JSON object, no explanations.
+
+JSON fields:
+- "disengage": true if the user wants to STOP talking to the assistant ("leave me alone", "not now", "I'm done", "bye" said alone). Opening/closing apps or searching is NEVER disengagement.
+- "search": true if it needs a web search, video search or real-time information (news, prices, facts, "find", "look up", "watch"). Weather queries and app commands are false.
+- "video": true if the user wants VIDEO content (video, videos, watch, movie, film, scene, youtube).
+- "weather": true if the user asks about weather, temperature or forecast.
+- "needs_current_info": true if answering needs CURRENT/REAL-TIME information (stock prices, news, sports results, "latest", "today's").
+- "app_action": "open" or "close" if the user wants to open/close an application, otherwise null.
+- "app_name": the application name for app_action, otherwise null.
+- "search_query": the exact Google/YouTube search terms with command words removed ("I want you to find Tesla stock price" -> "tesla stock price", "search a sport car on web browser" -> "sport car"), otherwise null.
+- "location": the place name for weather queries ("weather of Melbourne" -> "Melbourne"), otherwise null.
+
+Examples:
+- "open safari" -> {"disengage": false, "search": false, "video": false, "weather": false, "needs_current_info": false, "app_action": "open", "app_name": "safari", "search_query": null, "location": null}
+- "find out video of funny cats" -> {"disengage": false, "search": true, "video": true, "weather": false, "needs_current_info": false, "app_action": null, "app_name": null, "search_query": "funny cats", "location": null}
+- "I'm not in the mood to talk" -> {"disengage": true, "search": false, "video": false, "weather": false, "needs_current_info": false, "app_action": null, "app_name": null, "search_query": null, "location": null}""",
+        'user': "Query: \"{query}\"",
+        'lite': """Classify this voice assistant query. Reply with ONLY a JSON object with these fields:
+"disengage" (user wants to stop talking; app commands and searches never are), "search" (needs web/video search or live info; weather and app commands are false), "video" (wants video content), "weather", "needs_current_info", "app_action" ("open"/"close"/null), "app_name", "search_query" (search terms without command words), "location" (place for weather).
+Use false/null when a field doesn't apply.""",
+    },
+    # Per-probe fallbacks used when the intent engine is unavailable
+    'disengagement': {
+        'system': """Analyze if the user wants to STOP or DISENGAGE from the conversation with the AI assistant.
+
+Reply ONLY with "YES" if they want to stop/disengage, or "NO" if they want to continue.
+
+DISENGAGEMENT SIGNALS (YES):
+- "I don't want to say anything"
+- "I'm not in good mood to talk"
+- "Leave me alone"
+- "Stop talking"
+- "I don't want to chat"
+- "Not interested"
+- "Go away"
+- "I'm busy"
+- "Not now"
+- "Goodbye" (when said alone)
+- "Bye" (when said alone)
+- "That's all for now"
+- "I'm done"
+
+CONTINUE SIGNALS (NO):
+- "Close [app name]" → NO (app command, not disengagement)
+- "Let's close [app name]" → NO (app command, not disengagement)
+- "Open [app name]" → NO (app command)
+- "Search for something" → NO (search request)
+- Normal questions or conversations → NO
+- Requests for help → NO
+- Any productive interaction → NO
+
+CRITICAL: If the user mentions closing/opening specific applications (like "close Gemini", "close Gmail", "open Safari"), this is NOT disengagement - they want to control apps.""",
+        'user': "User said: \"{query}\"",
+        'lite': """Does the user want to STOP talking to the assistant ("leave me alone", "not now", "I'm done", "bye" said alone)?
+Opening/closing apps, searching and normal questions are NOT disengagement.
+Reply ONLY "YES" or "NO".""",
+    },
+    'contextual_confirmation': {
+        'system': """Based on our recent conversation, generate a natural check-in message.
+
+Create a brief, caring message that:
+1. Acknowledges we were discussing something specific
+2. Asks if they want to continue or need help with something else
+3. Sounds natural and personal
+
+Examples:
+- "Are you still there? Were you interested in learning more about those habits we discussed?"
+- "I was helping you with app management - did you want to continue or try something else?"
+- "We were talking about search features - are you still there sir?"
+""",
+        'user': "Recent conversation context: {context_text}\n\nGenerate one natural check-in message:",
+    },
+    'video_query': {
+        'system': """IMPORTANT: Analyze if user wants VIDEO content or TEXT/INFO content.
+
+Reply ONLY with "YES" for video content or "NO" for text/info content.
+
+VIDEO CONTENT (YES):
+- Contains: "video", "videos", "watch", "movie", "film", "scene", "youtube", "on youtube"
+- Contains: "find out video", "check out video", "search video", "video of"
+- Examples: "I want to watch a video of iPhone 15 Pro review" → YES
+- Examples: "video of MacBook Pro review" → YES
+- Examples: "let's find out video of cats" → YES
+- Examples: "check out video of Tesla" → YES
+- Examples: "search apple's news on Youtube" → YES
+- Examples: "find out openai latest update on youtube" → YES
+- Examples: "search video of funny dogs" → YES
+
+TEXT/INFO CONTENT (NO):
+- Wants: specs, price, information, facts, reviews (without video keywords)
+- Examples: "Tesla stock price" → NO
+- Examples: "iPhone 15 specifications" → NO
+- Examples: "search Tesla news" → NO (no video keyword)
+
+CRITICAL RULE: If query contains ANY video-related keywords (video, youtube, watch, movie, film) = YES, even if it also contains "search" or "find".""",
+        'user': "Query: \"{query}\"",
+        'lite': """Does the user want VIDEO content (mentions video, videos, watch, movie, film, scene or youtube)?
+Reply ONLY "YES" for video or "NO" for text/info.""",
+    },
+    'search_query': {
+        'system': """Analyze this user query and determine if it requires a web search, video search, or real-time information.
+
+Respond with only "YES" if it needs any kind of search/information lookup, or "NO" if it doesn't.
+
+IMPORTANT: Weather queries should be marked as "NO" since they use dedicated weather API.
+
+SEARCH/INFO QUERIES (YES):
+- "I want you to find Tesla stock price" → YES
+- "Let's search about climate change" → YES
+- "I want to watch Avengers movie" → YES
+- "I want to watch a video of dogs" → YES
+- "hey I want to watch a video of iPhone 15 Pro review" → YES
+- "let's search out today's market" → YES
+- "I want to check price of IBM" → YES
+- "what's today's Australian news" → YES
+- "who won the latest football match" → YES
+- "get me latest Tesla stock price" → YES
+- "what's happening in the world" → YES
+- "current Bitcoin price" → YES
+- "latest iPhone features" → YES
+- "search for something" → YES
+- "find information about" → YES
+- "look up" → YES
+
+NON-SEARCH QUERIES (NO):
+- "Open calculator" → NO
+- "Close Safari" → NO
+- "How are you" → NO
+- "Open Microsoft Word" → NO
+- "Launch an app" → NO
+- "Good morning" → NO
+- "Thank you" → NO
+- "what's the weather like" → NO (uses weather API)
+- "temperature in Melbourne" → NO (uses weather API)
+- "how's the weather" → NO (uses weather API)
+
+DECISION RULE: If user wants to FIND, SEARCH, WATCH, get current/real-time information, prices, news, or any content from the internet = YES. If they want to open/close apps, have simple conversations, or ask about WEATHER = NO.""",
+        'user': "Query: \"{query}\"",
+        'lite': """Does this query need a web search, video search or real-time information (find, search, watch, prices, news, latest)?
+Weather queries, app commands and small talk are NO.
+Reply ONLY "YES" or "NO".""",
+    },
+    'refine_search_query': {
+        'system': """User wants to search the web. Extract the perfect search query from their request.
+
+Provide ONLY the exact search terms needed for Google search. No explanations, no greetings, no extra words.
+
+Examples:
+- "I want you to find Tesla stock price" → tesla stock price
+- "Let's search about climate change effects" → climate change effects
+- "I want to watch Avengers Endgame movie" → Avengers Endgame movie
+- "Let's listen to Bohemian Rhapsody by Queen" → Bohemian Rhapsody Queen
+- "Find information about iPhone 15 reviews" → iPhone 15 reviews
+- "a car on a web browser" → car
+- "search a sport car on web browser" → sport car""",
+        'user': "User Request: \"{query}\"\n\nSearch Query:",
+    },
+    'needs_current_info': {
+        'system': """Analyze if this query needs CURRENT/REAL-TIME information that requires web search.
+
+Reply ONLY with "YES" if it needs current info, or "NO" if it doesn't.
+
+NEEDS CURRENT INFO (YES):
+- "I want to check price of IBM" → YES (stock prices change)
+- "what's today's Australian news" → YES (news is current)
+- "current Bitcoin price" → YES (prices change)
+- "latest iPhone features" → YES (product info changes)
+- "who won the latest football match" → YES (sports results)
+- "what's the weather like" → YES (weather changes)
+- "Tesla stock price today" → YES (stock prices)
+
+DOESN'T NEED CURRENT INFO (NO):
+- "How are you" → NO (general conversation)
+- "Open calculator" → NO (app command)
+- "what is 2+2" → NO (basic math)
+- "tell me a joke" → NO (general AI capability)
+- "good morning" → NO (greeting)
+
+DECISION: Does this query require CURRENT/REAL-TIME information from the internet?""",
+        'user': "Query: \"{query}\"",
+        'lite': """Does answering this query need CURRENT/REAL-TIME information from the internet (prices, news, sports results, "latest", "today's")?
+Reply ONLY "YES" or "NO".""",
+    },
+    'web_search_answer': {
+        'system': None,
+        'user': """Please provide current, up-to-date information about: {query}
+
+If this requires current/real-time data (like stock prices, news, weather, sports results),
+please indicate that you would need to search the web for the latest information.
+
+Query: {query}""",
+    },
+    # Weather
+    'coordinates': {
+        'system': """Give the exact latitude and longitude coordinates for the location the user names.
+
+Respond with ONLY the coordinates in this format: latitude,longitude
+
+Examples:
+- "Melbourne" → -37.8136,144.9631
+- "Sydney" → -33.8688,151.2093
+- "Brisbane" → -27.4698,153.0251
+- "Perth" → -31.9505,115.8605
+- "Adelaide" → -34.9285,138.6007
+- "Canberra" → -35.2809,149.1300
+- "Darwin" → -12.4634,130.8456
+- "Hobart" → -42.8821,147.3272
+- "Geelong" → -38.1499,144.3617
+- "Gold Coast" → -28.0167,153.4000
+- "London" → 51.5074,-0.1278
+- "New York" → 40.7128,-74.0060
+- "Tokyo" → 35.6762,139.6503""",
+        'user': "Location: \"{location_name}\"\n\nCoordinates:",
+    },
+    'weather_location': {
+        'system': """Extract the location name from this weather query. Reply with ONLY the location name, nothing else.
+
+Examples:
+- "find out weather of Melbourne" → Melbourne
+- "what's the weather in Sydney today" → Sydney
+- "check weather in New York" → New York
+- "Melbourne weather" → Melbourne
+- "weather in London please" → London
+- "how's the weather at Brisbane" → Brisbane
+
+If no location found, reply with: NONE""",
+        'user': "Query: \"{query}\"\n\nLocation:",
+        'lite': """Extract the location name from this weather query. Reply with ONLY the location name, or NONE if there is none.""",
+    },
+    # Apps
+    'web_url': {
+        'system': """The user wants to open an application or platform that is not installed on their device.
+Provide the EXACT web URL to open this application/platform in a browser.
+
+Respond with ONLY the URL, no explanations.
+If you don't know a real website for it, respond with NONE.
+
+Examples:
+- "Facebook" → https://www.facebook.com
+- "Spotify" → https://open.spotify.com
+- "Google Cloud" → https://console.cloud.google.com
+- "Instagram" → https://www.instagram.com
+- "Twitter" → https://twitter.com
+- "LinkedIn" → https://www.linkedin.com
+- "Discord" → https://discord.com/app
+- "Slack" → https://slack.com/signin
+- "Notion" → https://www.notion.so
+- "Figma" → https://www.figma.com""",
+        'user': "App/Platform: \"{app_name}\"\n\nURL:",
+    },
+}
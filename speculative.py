@@ -0,0 +1,78 @@
+"""
+Speculative probe execution for SYRA
+Independent LLM probes run concurrently under one shared deadline; the caller reads only the answers its decision needs
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+
+class ProbeRound:
+    """One batch of probes for a single query, sharing one deadline"""
+
+    def __init__(self, pool, deadline):
+        self.pool = pool
+        self.deadline_at = time.monotonic() + deadline
+        self.futures = {}
+        self.used = set()
+
+    def submit(self, name, fn, *args):
+        self.futures[name] = self.pool.submit(fn, *args)
+
+    def result(self, name, default=None):
+        """Answer of one probe, or default if it failed or the round's deadline passed"""
+        future = self.futures.get(name)
+        if future is None:
+            return default
+        self.used.add(name)
+
+        remaining = max(0.0, self.deadline_at - time.monotonic())
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeout:
+            print(f"⏱️ Probe '{name}' missed the deadline - using fallback")
+            return default
+        except Exception as e:
+            print(f"Probe '{name}' failed - using fallback: {e}")
+            return default
+
+    def cancel(self):
+        """Drop the probes nobody read - queued ones never start, running ones finish unheard"""
+        discarded = [name for name in self.futures if name not in self.used]
+        for name in discarded:
+            self.futures[name].cancel()
+        if discarded:
+            print(f"⚡ Discarded speculative probes: {', '.join(discarded)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cancel()
+        return False
+
+
+class SpeculativeExecutor:
+    def __init__(self, max_workers=4, deadline=10):
+        # One worker per probe in a round - a round never queues behind itself
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='syra-probe')
+        self.deadline = deadline
+
+    def round(self, deadline=None):
+        return ProbeRound(self.pool, deadline if deadline is not None else self.deadline)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_speculative_executor():
+    """Process-wide probe executor, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = SpeculativeExecutor()
+        return _executor
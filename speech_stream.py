@@ -0,0 +1,39 @@
+"""
+Sentence streaming helpers for SYRA
+Turns incremental LLM text into complete sentences as soon as they are available
+"""
+import re
+
+# A sentence ends at . ! or ? followed by whitespace, or at a line break (list items, paragraphs)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+
+
+def iter_sentences(chunks, min_chars=12):
+    """Yield complete sentences from a stream of text chunks.
+
+    Very short fragments ("Sure.", "1.") are merged into the following sentence
+    so TTS isn't asked to synthesize a single word on its own.
+    """
+    buffer = ''
+    sentence = ''
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+
+        parts = SENTENCE_BOUNDARY.split(buffer)
+        buffer = parts.pop()  # Last part may still be mid-sentence
+
+        for part in parts:
+            part = part.strip()
+            if not part:
+                continue
+            sentence = f"{sentence} {part}".strip()
+            if len(sentence) >= min_chars:
+                yield sentence
+                sentence = ''
+
+    tail = f"{sentence} {buffer.strip()}".strip()
+    if tail:
+        yield tail
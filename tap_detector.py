@@ -0,0 +1,138 @@
+"""
+Vectorized tap/clap detection for SYRA
+Detection features work on array/NumPy views over the raw int16 buffer - no per-sample Python loop
+"""
+import math
+import operator
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # RMS and peak still work on array views; spectral flux needs NumPy
+    np = None
+
+SHORT_NORMALIZE = (1.0/32768.0)
+INITIAL_TAP_THRESHOLD = 0.1
+INPUT_BLOCK_TIME = 0.05
+
+# Starting threshold per feature - each is adapted at runtime like the original RMS threshold
+FEATURE_THRESHOLDS = {
+    'rms': INITIAL_TAP_THRESHOLD,
+    'peak': 0.3,
+    'flux': 1.0
+}
+
+
+def get_samples(block):
+    """Zero-copy view over a raw little-endian int16 block"""
+    if np is not None:
+        return np.frombuffer(block, dtype='<i2')
+    return array('h', block)
+
+
+def get_rms(block):
+    """Normalized RMS amplitude of an int16 block"""
+    samples = get_samples(block)
+    count = len(samples)
+    if count == 0:
+        return 0.0
+
+    if np is not None:
+        as_float = samples.astype(np.float64)
+        sum_squares = float(np.dot(as_float, as_float))
+    else:
+        sum_squares = float(sum(map(operator.mul, samples, samples)))
+
+    return math.sqrt(sum_squares / count) * SHORT_NORMALIZE
+
+
+def get_peak(block):
+    """Normalized peak absolute amplitude of an int16 block"""
+    samples = get_samples(block)
+    if len(samples) == 0:
+        return 0.0
+
+    if np is not None:
+        peak = int(np.max(np.abs(samples.astype(np.int32))))
+    else:
+        peak = max(max(samples), -min(samples))
+
+    return peak * SHORT_NORMALIZE
+
+
+class SpectralFlux:
+    """Positive change in the magnitude spectrum between consecutive blocks - claps are broadband onsets"""
+
+    def __init__(self):
+        if np is None:
+            raise RuntimeError("Spectral flux detection requires NumPy")
+        self._previous = None
+        self._window = None
+
+    def __call__(self, block):
+        samples = get_samples(block).astype(np.float64) * SHORT_NORMALIZE
+        if samples.size == 0:
+            return 0.0
+
+        if self._window is None or self._window.size != samples.size:
+            self._window = np.hanning(samples.size)
+            self._previous = None
+
+        magnitude = np.abs(np.fft.rfft(samples * self._window)) * (2.0 / samples.size)
+        if self._previous is None:
+            flux = 0.0
+        else:
+            flux = float(np.sum(np.maximum(magnitude - self._previous, 0.0)))
+        self._previous = magnitude
+        return flux
+
+    def reset(self):
+        self._previous = None
+
+
+def make_feature(name):
+    if name == 'rms':
+        return get_rms
+    if name == 'peak':
+        return get_peak
+    if name == 'flux':
+        return SpectralFlux()
+    raise ValueError(f"Unknown tap detection feature: {name}")
+
+
+class TapDetector:
+    """Adaptive-threshold tap detector (the TapTester state machine) over a pluggable feature"""
+
+    def __init__(self, feature='rms', threshold=None, block_time=INPUT_BLOCK_TIME):
+        self.feature_name = feature
+        self.feature = make_feature(feature)
+        self.tap_threshold = FEATURE_THRESHOLDS[feature] if threshold is None else threshold
+
+        self.oversensitive = 15.0/block_time
+        self.undersensitive = 120.0/block_time
+        self.max_tap_blocks = 0.15/block_time
+
+        self.noisycount = self.max_tap_blocks+1
+        self.quietcount = 0
+
+    def process(self, block):
+        """Feed one block - returns True when a tap has just ended"""
+        amplitude = self.feature(block)
+
+        if amplitude > self.tap_threshold:
+            self.quietcount = 0
+            self.noisycount += 1
+            if self.noisycount > self.oversensitive:
+                self.tap_threshold *= 1.1
+            return False
+
+        tapped = 1 <= self.noisycount <= self.max_tap_blocks
+        self.noisycount = 0
+        self.quietcount += 1
+        if self.quietcount > self.undersensitive:
+            self.tap_threshold *= 2
+        return tapped
+
+    def note_error(self):
+        """Count a dropped block as a noisy block, as TapTester always has"""
+        self.noisycount = 1
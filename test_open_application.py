@@ -0,0 +1,70 @@
+"""
+Test script for open_application against the app inventory
+A current inventory that doesn't list an app must still let `open -a` try it once
+"""
+import os
+import subprocess
+import tempfile
+from unittest import mock
+
+os.environ.setdefault('MISTRAL_API_KEY', 'test')
+os.environ.setdefault('SYRA_CACHE_DIR', tempfile.mkdtemp(prefix='syra-test-'))
+
+import Assistance_SYRA_Final as syra
+from app_inventory import AppInventory
+from cache_store import JsonFileStore
+
+
+def make_current_inventory():
+    """An inventory scanned over one empty directory - current, but it knows no apps"""
+    app_dir = tempfile.mkdtemp(prefix='syra-apps-')
+    inventory = AppInventory(dirs=[app_dir], store=JsonFileStore('inventory', cache_dir=tempfile.mkdtemp()))
+    inventory._scan()
+    assert inventory.is_current()
+    return inventory
+
+
+def test_inventory_miss_still_tries_open_a():
+    print("🔧 Testing open_application with a current inventory miss...")
+    launched = []
+
+    def fake_run(command, check=False):
+        launched.append(command)
+        return subprocess.CompletedProcess(command, 0)
+
+    with mock.patch.object(syra, 'app_inventory', make_current_inventory()), \
+            mock.patch.object(syra.subprocess, 'run', side_effect=fake_run), \
+            mock.patch.object(syra, 'open_in_safari') as open_in_safari, \
+            mock.patch.object(syra, 'get_web_url_for_app') as get_web_url_for_app:
+        success, message = syra.open_application('finder')
+
+    assert success, message
+    assert launched == [['open', '-a', 'Finder']], launched
+    open_in_safari.assert_not_called()
+    get_web_url_for_app.assert_not_called()
+    print(f"✅ {message} via `open -a` - no web fallback")
+
+
+def test_inventory_miss_falls_back_when_open_a_fails():
+    print("\n🔧 Testing the web fallback after `open -a` fails...")
+    launched = []
+
+    def fake_run(command, check=False):
+        launched.append(command)
+        raise subprocess.CalledProcessError(1, command)
+
+    with mock.patch.object(syra, 'app_inventory', make_current_inventory()), \
+            mock.patch.object(syra.subprocess, 'run', side_effect=fake_run), \
+            mock.patch.object(syra, 'open_in_safari') as open_in_safari:
+        success, message = syra.open_application('spotify')
+
+    assert success, message
+    assert launched == [['open', '-a', 'Spotify']], launched
+    open_in_safari.assert_called_once_with('https://open.spotify.com')
+    print(f"✅ One `open -a` attempt, then: {message}")
+
+
+if __name__ == "__main__":
+    test_inventory_miss_still_tries_open_a()
+    test_inventory_miss_falls_back_when_open_a_fails()
+    print("\n🎉 open_application tests passed")
@@ -1,56 +1,198 @@
 """
 Translation Handler that works with multiple translation services
 """
-import requests
-from langdetect import detect
+import atexit
+import threading
+from collections import OrderedDict
+from http_client import get_http_client
+from cache_store import JsonFileStore
+from utterance import detect_language
+
+# Keep each batched GET comfortably under URL length limits
+MAX_BATCH_CHARS = 1800
+
+class TranslationCache:
+    """Bounded LRU of translations keyed by (src, dest, text), persisted to the cache directory"""
+    
+    def __init__(self, max_entries=1000, store=None, save_delay=5.0):
+        self.max_entries = max_entries
+        self.store = store or JsonFileStore('translations')
+        self.save_delay = save_delay  # New translations are written out together, off the turn path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_timer = None
+        
+        for entry in self.store.load().get('entries', []):
+            try:
+                src, dest, text, translated = entry
+            except (TypeError, ValueError):
+                continue
+            self._entries[(src, dest, text)] = translated
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def get(self, src, dest, text):
+        with self._lock:
+            translated = self._entries.get((src, dest, text))
+            if translated is not None:
+                self._entries.move_to_end((src, dest, text))
+            return translated
+    
+    def put_many(self, translations):
+        """Store {(src, dest, text): translated} - written to disk save_delay later, in the background"""
+        if not translations:
+            return
+        with self._lock:
+            for key, translated in translations.items():
+                self._entries.pop(key, None)
+                self._entries[key] = translated
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.save_delay, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self):
+        """Write pending translations now"""
+        with self._lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            snapshot = [[*key, translated] for key, translated in self._entries.items()]
+        self.store.save({'entries': snapshot})
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+def get_translation_cache():
+    """Process-wide TranslationCache so every handler shares one LRU and one file"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = TranslationCache()
+            atexit.register(_shared_cache.flush)
+        return _shared_cache
 
 class TranslationHandler:
-    def __init__(self):
+    def __init__(self, cache=None):
         self.google_translate_url = "https://translate.googleapis.com/translate_a/single"
+        self.http = get_http_client()
+        self.cache = cache or get_translation_cache()
         
     def translate_text(self, text, src='auto', dest='en'):
         """
         Translate text using Google Translate API directly
         Fallback when googletrans package has conflicts
         """
+        # Repeat commands skip language detection and the network hop
+        cached = self.cache.get(src, dest, text)
+        if cached is not None:
+            return cached
+        
+        requested_src = src
         if src == 'auto':
-            try:
-                src = detect(text)
-            except:
+            src, confidence = detect_language(text)
+            if confidence == 0.0:
                 src = 'auto'
         
         if src == dest:
             return text
             
         try:
-            # Using Google Translate's public API endpoint
-            params = {
-                'client': 'gtx',
-                'sl': src,
-                'tl': dest,
-                'dt': 't',
-                'q': text
-            }
-            
-            response = requests.get(self.google_translate_url, params=params)
-            
-            if response.status_code == 200:
-                result = response.json()
-                translated_text = result[0][0][0]
-                return translated_text
-            else:
-                return text  # Return original if translation fails
+            translated_text = self._request([text], src, dest)[0]
+            self.cache.put_many({(requested_src, dest, text): translated_text})
+            return translated_text
                 
         except Exception as e:
             print(f"Translation error: {e}")
             return text  # Return original if translation fails
     
+    def translate_batch(self, texts, src='auto', dest='en'):
+        """
+        Translate several strings, sending all cache misses in as few requests as possible
+        With src='auto' the misses are grouped by detected language - Google detects one per request
+        """
+        results = {text: self.cache.get(src, dest, text) for text in texts}
+        misses = [text for text, translated in results.items() if translated is None and text.strip()]
+        
+        # Source language -> misses in it
+        groups = {}
+        for text in misses:
+            text_src = src
+            if src == 'auto':
+                text_src, confidence = detect_language(text)
+                if confidence == 0.0:
+                    text_src = 'auto'
+            if text_src == dest:
+                results[text] = text
+                continue
+            groups.setdefault(text_src, []).append(text)
+        
+        translated = {}
+        for text_src, group in groups.items():
+            for chunk in self._chunk(group):
+                try:
+                    try:
+                        pairs = list(zip(chunk, self._request(chunk, text_src, dest)))
+                    except ValueError:
+                        # Segments didn't line up with the inputs - fall back to one text per request
+                        pairs = [(text, self._request([text], text_src, dest)[0]) for text in chunk]
+                except Exception as e:
+                    print(f"Translation error: {e}")
+                    continue
+                for text, translated_text in pairs:
+                    translated[(src, dest, text)] = translated_text
+                    results[text] = translated_text
+        self.cache.put_many(translated)
+        
+        # Anything that failed comes back untranslated, as translate_text does
+        return [results[text] if results[text] is not None else text for text in texts]
+    
+    def _chunk(self, texts):
+        # One segment per line - texts with their own newlines go on their own
+        chunk, size = [], 0
+        for text in texts:
+            if '\n' in text:
+                yield [text]
+                continue
+            if chunk and size + len(text) > MAX_BATCH_CHARS:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(text)
+            size += len(text) + 1
+        if chunk:
+            yield chunk
+    
+    def _request(self, texts, src, dest):
+        """One translate call for newline-joined texts - returns one translation per text"""
+        # Using Google Translate's public API endpoint
+        params = {
+            'client': 'gtx',
+            'sl': src,
+            'tl': dest,
+            'dt': 't',
+            'q': '\n'.join(texts)
+        }
+        
+        response = self.http.get(self.google_translate_url, endpoint='translate', params=params)
+        response.raise_for_status()
+        result = response.json()
+        
+        # Long input comes back as several segments - keep all of them, not just the first
+        translated_text = ''.join(segment[0] for segment in result[0] if segment and segment[0])
+        if len(texts) == 1:
+            return [translated_text]
+        
+        lines = translated_text.split('\n')
+        if len(lines) != len(texts):
+            raise ValueError(f"Batch translation returned {len(lines)} lines for {len(texts)} texts")
+        return [line.strip() for line in lines]
+    
     def detect_language(self, text):
         """Detect the language of the input text"""
-        try:
-            return detect(text)
-        except:
-            return 'en'  # Default to English if detection fails
+        return detect_language(text)[0]
 
 # Test the translation handler
 if __name__ == "__main__":
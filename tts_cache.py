@@ -0,0 +1,128 @@
+"""
+Persistent TTS phrase cache for SYRA
+Content-addressed mp3 files keyed by cleaned text and voice settings, with LRU size limits
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from cache_store import get_cache_dir
+
+
+class TTSCache:
+    def __init__(self, cache_dir=None, max_bytes=50 * 1024 * 1024, max_entries=1000):
+        self.cache_dir = cache_dir or get_cache_dir('tts')
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        # key -> file size, least recently used first
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    @staticmethod
+    def make_key(text, **voice):
+        """Content address for a phrase - the same text in another voice is a different entry"""
+        material = json.dumps([text, sorted(voice.items())], ensure_ascii=False)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, text, **voice):
+        """Return cached mp3 bytes for the phrase, or None on a miss"""
+        key = self.make_key(text, **voice)
+        with self._lock:
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                audio_bytes = f.read()
+            os.utime(path)  # Recency survives restarts via mtime
+            return audio_bytes
+        except OSError:
+            self._forget(key)
+            return None
+
+    def contains(self, text, **voice):
+        key = self.make_key(text, **voice)
+        with self._lock:
+            return key in self._index
+
+    def put(self, text, audio_bytes, **voice):
+        """Store synthesized audio for the phrase, evicting least recently used entries if needed"""
+        if not audio_bytes:
+            return
+
+        key = self.make_key(text, **voice)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(audio_bytes)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"TTS cache write error: {e}")
+            return
+
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(audio_bytes)
+            self._total_bytes += len(audio_bytes)
+            self._evict()
+
+    def warm_up(self, phrases, synthesize, **voice):
+        """Synthesize any phrases not cached yet on a background thread"""
+        def worker():
+            warmed = 0
+            for phrase in phrases:
+                if not phrase or self.contains(phrase, **voice):
+                    continue
+                try:
+                    self.put(phrase, synthesize(phrase), **voice)
+                    warmed += 1
+                except Exception as e:
+                    print(f"TTS warm-up error: {e}")
+                    return  # Most likely offline - try again next start
+            if warmed:
+                print(f"🔊 TTS cache warmed with {warmed} phrases")
+
+        thread = threading.Thread(target=worker, name="syra-tts-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def _load_index(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.mp3'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[:-len('.mp3')], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _forget(self, key):
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+
+    def _evict(self):
+        # Caller holds the lock (or is the constructor)
+        while self._index and (self._total_bytes > self.max_bytes or len(self._index) > self.max_entries):
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
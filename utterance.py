@@ -0,0 +1,77 @@
+"""
+Language-aware utterance for SYRA
+One object per turn carrying the recognized text, its detected language and its English translation
+"""
+import re
+
+from langdetect import DetectorFactory, detect_langs
+
+# langdetect is randomized unless seeded - the same phrase must always get the same answer
+DetectorFactory.seed = 0
+
+DEVANAGARI = re.compile(r'[\u0900-\u097F]')
+LATIN = re.compile(r'[A-Za-z]')
+
+# Below this many letters langdetect's guesses on Latin text are mostly noise
+MIN_LANGDETECT_LETTERS = 30
+
+
+def detect_script_language(text):
+    """(language, confidence) from the writing system alone, or None if the script doesn't decide it"""
+    devanagari = len(DEVANAGARI.findall(text))
+    latin = len(LATIN.findall(text))
+    letters = devanagari + latin
+    if letters == 0:
+        return None
+
+    if devanagari * 2 >= letters:
+        return 'hi', devanagari / letters
+
+    # Too short for langdetect - left undecided, so translation keeps Google's own auto-detection
+    if devanagari == 0 and latin < MIN_LANGDETECT_LETTERS:
+        return 'unknown', 0.0
+    return None
+
+
+def detect_language(text):
+    """Script check first, langdetect only when the script can't decide - returns (language, confidence)"""
+    detected = detect_script_language(text)
+    if detected is not None:
+        return detected
+
+    try:
+        best = detect_langs(text)[0]
+        return best.lang, best.prob
+    except Exception:
+        return 'en', 0.0  # Default to English if detection fails
+
+
+class Utterance:
+    def __init__(self, text, language='en', confidence=1.0, english_text=None):
+        self.text = text
+        self.language = language
+        self.confidence = confidence
+        # Filled in by translate() - English input is its own translation
+        self.english_text = english_text if english_text is not None else (text if language == 'en' else None)
+
+    @classmethod
+    def from_speech(cls, text):
+        """Detect the language of a recognized phrase once for the whole turn"""
+        language, confidence = detect_language(text)
+        return cls(text.lower(), language, confidence)
+
+    @property
+    def is_translated(self):
+        return self.language != 'en' and self.english_text is not None and self.english_text != self.text
+
+    def translate(self, translator):
+        """English text for the turn - only Hindi is translated, and only the first time it's asked for"""
+        if self.english_text is None:
+            if self.language == 'hi':
+                self.english_text = translator.translate_text(self.text, src='hi', dest='en')
+            else:
+                self.english_text = self.text
+        return self.english_text
+
+    def __repr__(self):
+        return f"Utterance({self.text!r}, language={self.language!r}, confidence={self.confidence:.2f})"
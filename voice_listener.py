@@ -0,0 +1,102 @@
+"""
+Persistent microphone session for SYRA
+Keeps one recognizer and one open input stream across turns and calibrates ambient noise once,
+recalibrating in the background only when the noise floor drifts
+"""
+import threading
+
+import speech_recognition as sr
+
+from tap_detector import SHORT_NORMALIZE, get_rms
+
+
+class VoiceListener:
+    def __init__(self, energy_threshold=300, pause_threshold=0.6, drift_ratio=1.5,
+                 monitor_interval=5.0, is_quiet=None, microphone=None):
+        self.recognizer = sr.Recognizer()
+
+        # Optimize recognizer settings for better performance
+        self.recognizer.energy_threshold = energy_threshold
+        self.recognizer.dynamic_energy_threshold = True
+        self.recognizer.pause_threshold = pause_threshold  # Faster response
+
+        # Any speech_recognition AudioSource - e.g. the clap trigger's already-open stream
+        self.microphone = microphone or sr.Microphone()
+        self.source = None
+
+        # Ambient RMS at the last calibration and how far it may move before recalibrating
+        self.noise_floor = None
+        self.drift_ratio = drift_ratio
+        self.monitor_interval = monitor_interval
+
+        # The monitor only samples when this says the room should be quiet (e.g. SYRA isn't talking)
+        self.is_quiet = is_quiet or (lambda: True)
+
+        # Only one reader of the stream at a time - listen() or the drift monitor
+        self._stream_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._monitor_thread = None
+
+    def open(self, calibration_duration=0.5):
+        """Open the microphone once, calibrate, and start the drift monitor"""
+        self.source = self.microphone.__enter__()
+        if self.source.stream is None:
+            raise OSError("Could not open the microphone input stream")
+
+        with self._stream_lock:
+            self._calibrate(calibration_duration)
+
+        self._monitor_thread = threading.Thread(target=self._monitor, name="syra-noise-monitor", daemon=True)
+        self._monitor_thread.start()
+        return self
+
+    def listen(self, timeout=10, phrase_time_limit=6):
+        """Capture one phrase from the already-open stream"""
+        with self._stream_lock:
+            return self.recognizer.listen(self.source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+
+    def recognize(self, audio, language='en-IN'):
+        return self.recognizer.recognize_google(audio, language=language)
+
+    def close(self):
+        self._closed.set()
+        if self.source is not None:
+            with self._stream_lock:
+                self.microphone.__exit__(None, None, None)
+            self.source = None
+
+    def _calibrate(self, duration, measured_floor=None):
+        # Caller holds the stream lock
+        self.recognizer.adjust_for_ambient_noise(self.source, duration=duration)
+        if measured_floor is None:
+            measured_floor = self.recognizer.energy_threshold / self.recognizer.dynamic_energy_ratio
+        self.noise_floor = max(measured_floor, 1.0)
+
+    def _sample_noise(self, duration=0.2):
+        """Mean RMS of a short slice of the stream - caller holds the stream lock"""
+        chunks = max(1, int(duration * self.source.SAMPLE_RATE / self.source.CHUNK))
+        total = 0
+        for _ in range(chunks):
+            buffer = self.source.stream.read(self.source.CHUNK)
+            # Raw int16 units, the same scale as the recognizer's energy threshold
+            total += get_rms(buffer) / SHORT_NORMALIZE
+        return total / chunks
+
+    def _monitor(self):
+        while not self._closed.wait(self.monitor_interval):
+            if not self.is_quiet():
+                continue
+            # Never block a turn - skip this round if listen() owns the stream
+            if not self._stream_lock.acquire(blocking=False):
+                continue
+            try:
+                if self.source is None:
+                    return
+                energy = self._sample_noise()
+                if energy > self.noise_floor * self.drift_ratio or energy < self.noise_floor / self.drift_ratio:
+                    print(f"🎚️ Noise floor drifted ({self.noise_floor:.0f} → {energy:.0f}) - recalibrating")
+                    self._calibrate(0.3, measured_floor=energy)
+            except Exception as e:
+                print(f"Noise monitor error: {e}")
+            finally:
+                self._stream_lock.release()
@@ -0,0 +1,121 @@
+"""
+Weather service for SYRA
+Open-Meteo current conditions with a short-TTL cache, in-flight request coalescing and bulk lookups
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from http_client import get_http_client
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+
+CURRENT_FIELDS = (
+    'temperature_2m', 'relative_humidity_2m', 'apparent_temperature',
+    'precipitation', 'rain', 'weather_code'
+)
+
+
+class _PendingFetch:
+    """One in-flight fetch that concurrent callers for the same key wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class WeatherService:
+    def __init__(self, http=None, ttl=600, precision=2, max_entries=256):
+        self.http = http or get_http_client()
+        self.ttl = ttl                # Open-Meteo current conditions refresh every 15 minutes
+        self.precision = precision    # 2 decimal places is about 1 km
+        self.max_entries = max_entries
+
+        # key -> (fetched_at, current conditions), least recently used first
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, lat, lon, fields=CURRENT_FIELDS):
+        return round(lat, self.precision), round(lon, self.precision), tuple(sorted(fields))
+
+    def current(self, lat, lon, fields=CURRENT_FIELDS):
+        """Current conditions dict for one location"""
+        return self.current_bulk([(lat, lon)], fields)[0]
+
+    def current_bulk(self, locations, fields=CURRENT_FIELDS):
+        """Current conditions for several (lat, lon) pairs - all misses go out in one Open-Meteo call"""
+        keys = [self.make_key(lat, lon, fields) for lat, lon in locations]
+        results = {}
+        waiting = {}
+        to_fetch = {}
+
+        with self._lock:
+            now = time.time()
+            for key in dict.fromkeys(keys):
+                entry = self._cache.get(key)
+                if entry is not None and now - entry[0] < self.ttl:
+                    self._cache.move_to_end(key)
+                    results[key] = entry[1]
+                elif key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                else:
+                    to_fetch[key] = self._inflight[key] = _PendingFetch()
+
+        if to_fetch:
+            self._fetch(to_fetch, fields)
+            waiting.update(to_fetch)
+
+        for key, pending in waiting.items():
+            results[key] = pending.wait()
+
+        return [results[key] for key in keys]
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _fetch(self, pending, fields):
+        """Fetch the pending keys in one request and resolve everyone waiting on them"""
+        keys = list(pending)
+        try:
+            response = self.http.get(
+                OPEN_METEO_URL,
+                endpoint='open_meteo',
+                params={
+                    'latitude': ','.join(str(key[0]) for key in keys),
+                    'longitude': ','.join(str(key[1]) for key in keys),
+                    'current': ','.join(fields),
+                    'timezone': 'auto'
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+            # Open-Meteo answers a single location with an object and several with a list
+            locations = data if isinstance(data, list) else [data]
+            if len(locations) != len(keys):
+                raise ValueError(f"Expected {len(keys)} locations from Open-Meteo, got {len(locations)}")
+
+            fetched_at = time.time()
+            with self._lock:
+                for key, location in zip(keys, locations):
+                    pending[key].result = location['current']
+                    self._cache.pop(key, None)
+                    self._cache[key] = (fetched_at, location['current'])
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        except Exception as e:
+            for fetch in pending.values():
+                fetch.error = e
+        finally:
+            with self._lock:
+                for key, fetch in pending.items():
+                    self._inflight.pop(key, None)
+                    fetch.done.set()